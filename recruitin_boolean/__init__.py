@@ -55,10 +55,29 @@ python -m recruitin_boolean -i vacatures.xlsx -o exports/
 - `pipeline/`: Main processor, exporters, and CLI interface
 """
 
-from .pipeline import JobDiggerBooleanProcessor, ExcelExporter, DataExporter
-from .models import FunctieGroep, FUNCTIEGROEPEN
-from .search import BooleanSearchGenerator, SearchValidator
-from .ai import LookAlikeMatcher, HuggingFaceDataGenerator
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .pipeline import JobDiggerBooleanProcessor, ExcelExporter, DataExporter
+    from .models import FunctieGroep, FUNCTIEGROEPEN
+    from .search import BooleanSearchGenerator, SearchValidator
+    from .ai import LookAlikeMatcher, HuggingFaceDataGenerator
+
+# Publieke naam -> subpackage. De subpackages worden pas geïmporteerd bij het
+# eerste gebruik, zodat bijvoorbeeld ``recruitin_boolean.models`` niet de
+# import van pandas (pipeline) en numpy (ai) betaalt.
+_LAZY_IMPORTS = {
+    "JobDiggerBooleanProcessor": ".pipeline",
+    "ExcelExporter": ".pipeline",
+    "DataExporter": ".pipeline",
+    "FunctieGroep": ".models",
+    "FUNCTIEGROEPEN": ".models",
+    "BooleanSearchGenerator": ".search",
+    "SearchValidator": ".search",
+    "LookAlikeMatcher": ".ai",
+    "HuggingFaceDataGenerator": ".ai",
+}
 
 __version__ = "1.0.0"
 __author__ = "Recruitin B.V."
@@ -79,3 +98,17 @@ __all__ = [
     "ExcelExporter",
     "DataExporter",
 ]
+
+
+def __getattr__(name: str):
+    """Import public names from their subpackage on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
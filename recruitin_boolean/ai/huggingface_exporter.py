@@ -9,12 +9,103 @@ Generates training datasets for various machine learning tasks including:
 """
 
 import json
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain, islice, product, repeat
 from pathlib import Path
-from typing import Dict, List
-from dataclasses import asdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from dataclasses import fields, is_dataclass
 
 from ..models import FunctieGroep
+from ..models.functiegroep import _TERM_FIELDS
+
+try:
+    import orjson
+except ImportError:  # optional dependency, fall back to the stdlib encoder
+    orjson = None
+
+# Dataset columns with few distinct values, dictionary encoded in Arrow tables
+_CATEGORICAL_COLUMNS = frozenset({"label", "category", "match_type", "functiegroep"})
+
+# NER entity states and the BIO tag for (previous state, current state)
+_OUTSIDE, _TITLE, _SKILL = 0, 1, 2
+_BIO_TAGS = (
+    ("O", "B-TITLE", "B-SKILL"),  # na O
+    ("O", "I-TITLE", "B-SKILL"),  # na TITLE
+    ("O", "B-TITLE", "I-SKILL"),  # na SKILL
+)
+
+# Shared compact encoder for the stdlib JSONL path, same output as orjson
+_encode_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+# Number of JSONL rows serialized per write call
+_JSONL_BATCH_SIZE = 10_000
+
+
+def _batched(items: Iterable, size: int) -> Iterator[List]:
+    """Yield lists of at most ``size`` consecutive items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _dataclass_fields(obj) -> Dict:
+    """
+    JSON ``default`` hook that serializes dataclasses by their fields.
+
+    Unlike ``dataclasses.asdict`` the field values are not deep-copied first;
+    the encoder walks them directly.
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _tally(items: Iterable[Dict], counter: Counter, key: str) -> Iterator[Dict]:
+    """Pass items through unchanged while counting their ``key`` values."""
+    for item in items:
+        counter[item[key]] += 1
+        yield item
+
+
+def _count(items: Iterable) -> int:
+    """Count items without materializing a generator."""
+    if isinstance(items, list):
+        return len(items)
+    return sum(1 for _ in items)
+
+
+def _write_jsonl(path: Path, items: Iterable[Dict]) -> int:
+    """
+    Write items to a JSON Lines file.
+
+    Rows are serialized in batches and written with a single call per batch,
+    so ``items`` may be a generator that is never held in memory as a whole.
+    Uses orjson when installed, which encodes straight to UTF-8 bytes.
+
+    Args:
+        path: Output file path
+        items: Dictionaries to write, one per line
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        with open(path, "wb") as f:
+            for batch in _batched(items, _JSONL_BATCH_SIZE):
+                f.write(b"".join([orjson.dumps(item, option=option) for item in batch]))
+                count += len(batch)
+        return count
+
+    with open(path, "w", encoding="utf-8") as f:
+        for batch in _batched(items, _JSONL_BATCH_SIZE):
+            f.write("\n".join([_encode_json(item) for item in batch]) + "\n")
+            count += len(batch)
+    return count
 
 
 class HuggingFaceDataGenerator:
@@ -36,6 +127,22 @@ class HuggingFaceDataGenerator:
         """
         self.functiegroepen = functiegroepen
 
+        # Cached dataset outputs (see clear_cache)
+        self._classification_cache: Optional[List[Dict]] = None
+        self._similarity_cache: Optional[List[Dict]] = None
+        self._ner_cache: Optional[List[Dict]] = None
+
+    def clear_cache(self) -> None:
+        """
+        Clear the cached datasets.
+
+        Call this after modifying ``functiegroepen`` so the next call to one of
+        the ``generate_*_dataset`` methods rebuilds the data.
+        """
+        self._classification_cache = None
+        self._similarity_cache = None
+        self._ner_cache = None
+
     def generate_classification_dataset(self) -> List[Dict]:
         """
         Genereert dataset voor text classification.
@@ -46,38 +153,47 @@ class HuggingFaceDataGenerator:
         Returns:
             List of dictionaries with format: {"text": "...", "label": "functiegroep_id"}
         """
-        dataset = []
+        if self._classification_cache is None:
+            self._classification_cache = list(self._iter_classification())
+        return self._classification_cache
+
+    def _iter_classification(self) -> Iterator[Dict]:
+        """Yield the classification samples one at a time, without caching."""
+        return (
+            {"text": text, "label": label, "category": category}
+            for text, label, category in self._iter_classification_rows()
+        )
+
+    def _iter_classification_rows(self) -> Iterator[Tuple[str, str, str]]:
+        """
+        Yield the classification samples as ``(text, label, category)`` tuples.
 
+        The dictionaries are only built by consumers that need them, so
+        column-oriented consumers such as ``to_arrow_table`` skip the per-row
+        dict allocation.
+        """
         for fg_id, fg in self.functiegroepen.items():
-            # Genereer variaties van titels
-            for title in fg.titels + fg.synoniemen + fg.english_titles:
-                dataset.append(
-                    {"text": title, "label": fg_id, "category": fg.categorie}
-                )
+            # Eén gedeeld str-object per label/categorie voor alle samples
+            fg_id = sys.intern(fg_id)
+            category = sys.intern(fg.categorie)
 
-            # Genereer combinaties van titel + skills
-            for title in fg.titels:
-                for skill in fg.skills[:5]:  # Top 5 skills only
-                    dataset.append(
-                        {
-                            "text": f"{title} met ervaring in {skill}",
-                            "label": fg_id,
-                            "category": fg.categorie,
-                        }
-                    )
-
-            # Genereer combinaties met sector keywords
-            for title in fg.titels:
-                for keyword in fg.sector_keywords[:3]:  # Top 3 keywords only
-                    dataset.append(
-                        {
-                            "text": f"{title} {keyword}",
-                            "label": fg_id,
-                            "category": fg.categorie,
-                        }
-                    )
-
-        return dataset
+            # Genereer variaties van titels
+            yield from (
+                (title, fg_id, category)
+                for title in chain(fg.titels, fg.synoniemen, fg.english_titles)
+            )
+
+            # Genereer combinaties van titel + skills (top 5 skills only)
+            yield from (
+                (f"{title} met ervaring in {skill}", fg_id, category)
+                for title, skill in product(fg.titels, fg.skills[:5])
+            )
+
+            # Genereer combinaties met sector keywords (top 3 keywords only)
+            yield from (
+                (f"{title} {keyword}", fg_id, category)
+                for title, keyword in product(fg.titels, fg.sector_keywords[:3])
+            )
 
     def generate_similarity_dataset(self) -> List[Dict]:
         """
@@ -90,66 +206,84 @@ class HuggingFaceDataGenerator:
             List of dictionaries with format:
             {"sentence1": "vacature", "sentence2": "profiel", "score": 0.0-1.0}
         """
-        dataset = []
+        if self._similarity_cache is None:
+            self._similarity_cache = list(self._iter_similarity())
+        return self._similarity_cache
+
+    def _iter_similarity(self) -> Iterator[Dict]:
+        """Yield the similarity samples one at a time, without caching."""
+        # Negatieve voorbeelden hangen alleen af van de categorie: bepaal per
+        # categorie eenmalig de eerste 3 functiegroepen uit andere categorieën
+        negatives_by_category: Dict[str, List[FunctieGroep]] = {}
+        for fg in self.functiegroepen.values():
+            if fg.categorie not in negatives_by_category:
+                negatives_by_category[fg.categorie] = list(
+                    islice(
+                        (
+                            f
+                            for f in self.functiegroepen.values()
+                            if f.categorie != fg.categorie
+                        ),
+                        3,
+                    )
+                )
 
-        for fg_id, fg in self.functiegroepen.items():
+        functiegroepen = self.functiegroepen
+        for fg_id, fg in functiegroepen.items():
             # Positieve matches (hoge score)
-            for title in fg.titels:
-                for synonym in fg.synoniemen:
-                    dataset.append(
-                        {
-                            "sentence1": f"Vacature: {title}",
-                            "sentence2": f"Profiel: {synonym}",
-                            "score": 0.95,
-                            "match_type": "exact",
-                        }
-                    )
+            vacatures = [f"Vacature: {title}" for title in fg.titels]
+            profielen = [f"Profiel: {synonym}" for synonym in fg.synoniemen]
+            yield from (
+                {
+                    "sentence1": vacature,
+                    "sentence2": profiel,
+                    "score": 0.95,
+                    "match_type": "exact",
+                }
+                for vacature, profiel in product(vacatures, profielen)
+            )
+
+            # Skill matches (medium-hoge score) - top 10 skills
+            ervaringen = [(skill, f"Ervaring: {skill}") for skill in fg.skills[:10]]
+            yield from (
+                {
+                    "sentence1": f"Vacature: {title} met {skill}",
+                    "sentence2": ervaring,
+                    "score": 0.8,
+                    "match_type": "skill",
+                }
+                for title in fg.titels
+                for skill, ervaring in ervaringen
+            )
 
-            # Skill matches (medium-hoge score)
-            for title in fg.titels:
-                for skill in fg.skills[:10]:  # Top 10 skills
-                    dataset.append(
+            # Look-alike matches (medium score)
+            top_vacatures = vacatures[:2]
+            for la_id in fg.look_alikes:
+                la_fg = functiegroepen.get(la_id)
+                if la_fg is not None:
+                    yield from (
                         {
-                            "sentence1": f"Vacature: {title} met {skill}",
-                            "sentence2": f"Ervaring: {skill}",
-                            "score": 0.8,
-                            "match_type": "skill",
+                            "sentence1": vacature,
+                            "sentence2": f"Profiel: {title2}",
+                            "score": 0.6,
+                            "match_type": "lookalike",
                         }
+                        for vacature, title2 in product(top_vacatures, la_fg.titels[:2])
                     )
 
-            # Look-alike matches (medium score)
-            for la_id in fg.look_alikes:
-                if la_id in self.functiegroepen:
-                    la_fg = self.functiegroepen[la_id]
-                    for title1 in fg.titels[:2]:
-                        for title2 in la_fg.titels[:2]:
-                            dataset.append(
-                                {
-                                    "sentence1": f"Vacature: {title1}",
-                                    "sentence2": f"Profiel: {title2}",
-                                    "score": 0.6,
-                                    "match_type": "lookalike",
-                                }
-                            )
-
             # Negatieve matches (lage score) - different categories
-            other_categories = [
-                f for f in self.functiegroepen.values() if f.categorie != fg.categorie
-            ]
-            for other_fg in other_categories[
-                :3
-            ]:  # Max 3 negative examples per function group
-                dataset.append(
+            negatives = negatives_by_category[fg.categorie]
+            if negatives:
+                yield from (
                     {
-                        "sentence1": f"Vacature: {fg.titels[0]}",
+                        "sentence1": vacatures[0],
                         "sentence2": f"Profiel: {other_fg.titels[0]}",
                         "score": 0.1,
                         "match_type": "negative",
                     }
+                    for other_fg in negatives
                 )
 
-        return dataset
-
     def generate_ner_dataset(self) -> List[Dict]:
         """
         Genereert dataset voor Named Entity Recognition (skill extractie).
@@ -160,66 +294,69 @@ class HuggingFaceDataGenerator:
         Returns:
             List of dictionaries with format: {"tokens": [...], "ner_tags": [...]}
         """
-        dataset = []
+        if self._ner_cache is None:
+            self._ner_cache = list(self._iter_ner())
+        return self._ner_cache
 
+    def _iter_ner(self) -> Iterator[Dict]:
+        """Yield the NER samples one at a time, without caching."""
         for fg_id, fg in self.functiegroepen.items():
+            # Top 3 skills per title, eenmalig getokeniseerd per functiegroep
+            top_skills = [
+                (skill_words, set(skill_words))
+                for skill_words in (skill.split() for skill in fg.skills[:3])
+            ]
+
             # Genereer voorbeeldzinnen met getagde entities
             for title in fg.titels:
-                for skill in fg.skills[:3]:  # Top 3 skills per title
-                    text = f"Gezocht: {title} met kennis van {skill}"
-                    tokens = text.split()
+                title_words = title.split()
+                title_tokens = set(title_words)
+                # Tokens of "Gezocht: {title} met kennis van {skill}"
+                prefix = ["Gezocht:", *title_words, "met", "kennis", "van"]
+
+                for skill_words, skill_tokens in top_skills:
+                    tokens = prefix + skill_words
                     tags = []
 
+                    prev = _OUTSIDE
                     for token in tokens:
-                        if token in title.split():
-                            tags.append(
-                                "B-TITLE"
-                                if not tags or tags[-1] not in ["B-TITLE", "I-TITLE"]
-                                else "I-TITLE"
-                            )
-                        elif token in skill.split():
-                            tags.append(
-                                "B-SKILL"
-                                if not tags or tags[-1] not in ["B-SKILL", "I-SKILL"]
-                                else "I-SKILL"
-                            )
+                        if token in title_tokens:
+                            entity = _TITLE
+                        elif token in skill_tokens:
+                            entity = _SKILL
                         else:
-                            tags.append("O")
+                            entity = _OUTSIDE
+                        tags.append(_BIO_TAGS[prev][entity])
+                        prev = entity
 
-                    dataset.append(
-                        {"tokens": tokens, "ner_tags": tags, "functiegroep": fg_id}
-                    )
+                    yield {"tokens": tokens, "ner_tags": tags, "functiegroep": fg_id}
 
             # Certificeringen
             for cert in fg.certificeringen[:5]:  # Top 5 certifications
-                text = f"Vereist: certificering {cert}"
-                tokens = text.split()
-
-                # Create proper BIO tags for certification
-                tags = ["O", "O"]  # "Vereist:" "certificering"
+                # Tokens of "Vereist: certificering {cert}" with BIO tags
                 cert_tokens = cert.split()
+                tokens = ["Vereist:", "certificering", *cert_tokens]
+                tags = ["O", "O"]
                 if cert_tokens:
                     tags.append("B-CERT")
                     tags.extend(["I-CERT"] * (len(cert_tokens) - 1))
 
-                # Ensure tags match tokens length
-                tags = tags[: len(tokens)]
-                if len(tags) < len(tokens):
-                    tags.extend(["O"] * (len(tokens) - len(tags)))
-
-                dataset.append(
-                    {"tokens": tokens, "ner_tags": tags, "functiegroep": fg_id}
-                )
-
-        return dataset
+                yield {"tokens": tokens, "ner_tags": tags, "functiegroep": fg_id}
 
-    def generate_training_data_bundle(self) -> Dict:
+    def generate_training_data_bundle(self, max_workers: Optional[int] = None) -> Dict:
         """
         Genereert complete training data bundle voor alle modellen.
 
+        Args:
+            max_workers: When set, datasets that are not cached yet are built
+                concurrently in up to this many worker processes
+
         Returns:
             Dictionary containing all training datasets and metadata
         """
+        if max_workers:
+            self._build_datasets_parallel(max_workers)
+
         return {
             "classification": self.generate_classification_dataset(),
             "similarity": self.generate_similarity_dataset(),
@@ -231,6 +368,34 @@ class HuggingFaceDataGenerator:
             },
         }
 
+    def _build_datasets_parallel(self, max_workers: int) -> None:
+        """
+        Build the uncached datasets in worker processes and cache the results.
+
+        The three generators are independent of each other, so the wall time
+        becomes that of the slowest one instead of the sum.
+
+        Args:
+            max_workers: Maximum number of worker processes
+        """
+        builders = {
+            "_classification_cache": self.generate_classification_dataset,
+            "_similarity_cache": self.generate_similarity_dataset,
+            "_ner_cache": self.generate_ner_dataset,
+        }
+        missing = {
+            attr: builder
+            for attr, builder in builders.items()
+            if getattr(self, attr) is None
+        }
+        if not missing:
+            return
+
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+            futures = {attr: pool.submit(builder) for attr, builder in missing.items()}
+            for attr, future in futures.items():
+                setattr(self, attr, future.result())
+
     def export_to_huggingface_format(self, output_dir: Path) -> Dict[str, Path]:
         """
         Exporteert training data in Hugging Face compatible formaten.
@@ -247,41 +412,42 @@ class HuggingFaceDataGenerator:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        files = {}
-
-        # Classification dataset (JSONL)
-        classification_data = self.generate_classification_dataset()
-        classification_path = output_dir / "classification_train.jsonl"
-        with open(classification_path, "w", encoding="utf-8") as f:
-            for item in classification_data:
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
-        files["classification"] = classification_path
-
-        # Similarity dataset (JSONL)
-        similarity_data = self.generate_similarity_dataset()
-        similarity_path = output_dir / "similarity_train.jsonl"
-        with open(similarity_path, "w", encoding="utf-8") as f:
-            for item in similarity_data:
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
-        files["similarity"] = similarity_path
-
-        # NER dataset (JSONL)
-        ner_data = self.generate_ner_dataset()
-        ner_path = output_dir / "ner_train.jsonl"
-        with open(ner_path, "w", encoding="utf-8") as f:
-            for item in ner_data:
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
-        files["ner"] = ner_path
+        files = {
+            "classification": output_dir / "classification_train.jsonl",
+            "similarity": output_dir / "similarity_train.jsonl",
+            "ner": output_dir / "ner_train.jsonl",
+        }
+
+        datasets = {model_type: self._iter_dataset(model_type) for model_type in files}
+
+        # Labels worden geteld terwijl de classification samples geschreven
+        # worden, zodat de label distributie geen extra pass kost
+        label_counts = Counter()
+        datasets["classification"] = _tally(
+            datasets["classification"], label_counts, "label"
+        )
+
+        # Datasets (JSONL) - write the files concurrently so file I/O of one
+        # dataset overlaps with generating and encoding the others
+        with ThreadPoolExecutor(max_workers=len(files)) as pool:
+            futures = {
+                model_type: pool.submit(_write_jsonl, path, datasets[model_type])
+                for model_type, path in files.items()
+            }
+            counts = {
+                model_type: future.result() for model_type, future in futures.items()
+            }
 
         # Metadata
         metadata = {
-            "functiegroepen": {
-                fg_id: asdict(fg) for fg_id, fg in self.functiegroepen.items()
-            },
+            "functiegroepen": dict(self.functiegroepen),
             "statistics": {
-                "total_classification_samples": len(classification_data),
-                "total_similarity_samples": len(similarity_data),
-                "total_ner_samples": len(ner_data),
+                "total_classification_samples": counts["classification"],
+                "total_similarity_samples": counts["similarity"],
+                "total_ner_samples": counts["ner"],
+                "label_distribution": {
+                    fg_id: label_counts[fg_id] for fg_id in self.functiegroepen
+                },
             },
             "generated_at": datetime.now().isoformat(),
             "data_version": "1.0",
@@ -293,7 +459,9 @@ class HuggingFaceDataGenerator:
         }
         metadata_path = output_dir / "metadata.json"
         with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+            json.dump(
+                metadata, f, indent=2, ensure_ascii=False, default=_dataclass_fields
+            )
         files["metadata"] = metadata_path
 
         # Generate training config files for each task
@@ -375,28 +543,153 @@ class HuggingFaceDataGenerator:
         Returns:
             Path to the generated training file
         """
+        data = self._iter_dataset(model_type)
+
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        if model_type == "classification":
-            data = self.generate_classification_dataset()
-            filename = "classification_optimized.jsonl"
-        elif model_type == "similarity":
-            data = self.generate_similarity_dataset()
-            filename = "similarity_optimized.jsonl"
-        elif model_type == "ner":
-            data = self.generate_ner_dataset()
-            filename = "ner_optimized.jsonl"
+        output_path = output_dir / f"{model_type}_optimized.jsonl"
+        _write_jsonl(output_path, data)
+
+        return output_path
+
+    def to_arrow_table(self, model_type: str):
+        """
+        Build an Apache Arrow table for a specific model type.
+
+        Columns are filled directly from the dataset, so the table can be
+        wrapped with ``datasets.Dataset(table)`` without a JSONL round-trip.
+        Low-cardinality string columns (labels, categories, match types) are
+        dictionary encoded. Requires ``pyarrow`` (installed with ``datasets``).
+
+        Args:
+            model_type: Type of model ('classification', 'similarity', 'ner')
+
+        Returns:
+            pyarrow.Table with one column per dataset field
+        """
+        import pyarrow as pa
+
+        if model_type == "classification" and self._classification_cache is None:
+            # Column-wise straight from the row tuples, no per-row dicts
+            rows = list(self._iter_classification_rows())
+            columns = dict(zip(("text", "label", "category"), zip(*rows)))
         else:
-            raise ValueError(f"Unknown model type: {model_type}")
+            data = self._get_dataset(model_type)
+            if not data:
+                return pa.table({})
+            columns = {key: [item[key] for item in data] for key in data[0]}
 
-        output_path = output_dir / filename
-        with open(output_path, "w", encoding="utf-8") as f:
-            for item in data:
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+        if not columns:
+            return pa.table({})
+
+        arrays = {}
+        for key, values in columns.items():
+            array = pa.array(values)
+            if key in _CATEGORICAL_COLUMNS:
+                array = array.dictionary_encode()
+            arrays[key] = array
+
+        return pa.table(arrays)
+
+    def export_functiegroepen_parquet(self, output_dir: Path) -> Path:
+        """
+        Export the functiegroepen as a Parquet file.
+
+        One row per functiegroep with one column per ``FunctieGroep`` field;
+        list fields become ``list<string>`` columns. Compact and columnar, and
+        loadable with ``datasets.Dataset.from_parquet``. Requires ``pyarrow``.
+
+        Args:
+            output_dir: Directory to save the file
+
+        Returns:
+            Path to the generated Parquet file
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        groups = list(self.functiegroepen.values())
+        columns = {}
+        for f in fields(FunctieGroep):
+            values = pa.array([getattr(fg, f.name) for fg in groups])
+            if f.name == "categorie":
+                values = values.dictionary_encode()
+            columns[f.name] = values
+
+        output_path = output_dir / "functiegroepen.parquet"
+        pq.write_table(pa.table(columns), output_path, compression="zstd")
 
         return output_path
 
+    def to_term_table(self):
+        """
+        Build a long-format Apache Arrow table of all taxonomy terms.
+
+        One row per (functiegroep, field, term) for the term fields of
+        ``FunctieGroep``; all three columns are dictionary encoded. Queries
+        over the whole taxonomy then run as vectorized Arrow compute instead
+        of Python loops, e.g. the groups with one of a set of terms::
+
+            terms = generator.to_term_table()
+            mask = pc.is_in(terms["term"], value_set=pa.array(["HVAC", "PLC"]))
+            pc.unique(terms.filter(mask)["functiegroep"])
+
+        Requires ``pyarrow``.
+
+        Returns:
+            pyarrow.Table with columns functiegroep, field and term
+        """
+        import pyarrow as pa
+
+        fg_ids: List[str] = []
+        field_names: List[str] = []
+        terms: List[str] = []
+        for fg_id, fg in self.functiegroepen.items():
+            for name in _TERM_FIELDS:
+                values = getattr(fg, name)
+                fg_ids.extend(repeat(fg_id, len(values)))
+                field_names.extend(repeat(name, len(values)))
+                terms.extend(values)
+
+        return pa.table(
+            {
+                "functiegroep": pa.array(fg_ids, pa.string()).dictionary_encode(),
+                "field": pa.array(field_names, pa.string()).dictionary_encode(),
+                "term": pa.array(terms, pa.string()).dictionary_encode(),
+            }
+        )
+
+    def _get_dataset(self, model_type: str) -> List[Dict]:
+        """Return the dataset for a model type ('classification', 'similarity', 'ner')."""
+        if model_type == "classification":
+            return self.generate_classification_dataset()
+        if model_type == "similarity":
+            return self.generate_similarity_dataset()
+        if model_type == "ner":
+            return self.generate_ner_dataset()
+        raise ValueError(f"Unknown model type: {model_type}")
+
+    def _iter_dataset(self, model_type: str) -> Iterable[Dict]:
+        """
+        Return the cached dataset for a model type, or a generator over it.
+
+        Used by the exports, which only need a single pass over the samples
+        and therefore do not have to materialize uncached datasets.
+        """
+        iterators = {
+            "classification": (self._classification_cache, self._iter_classification),
+            "similarity": (self._similarity_cache, self._iter_similarity),
+            "ner": (self._ner_cache, self._iter_ner),
+        }
+        if model_type not in iterators:
+            raise ValueError(f"Unknown model type: {model_type}")
+        cache, iterate = iterators[model_type]
+        return cache if cache is not None else iterate()
+
     def get_label_mapping(self) -> Dict:
         """
         Get label mapping for classification tasks.
@@ -416,15 +709,16 @@ class HuggingFaceDataGenerator:
         Returns:
             Dictionary with training data statistics
         """
-        classification_data = self.generate_classification_dataset()
-        similarity_data = self.generate_similarity_dataset()
-        ner_data = self.generate_ner_dataset()
+        # Eén pass over de classification samples voor alle label tellingen
+        label_counts = Counter(
+            item["label"] for item in self._iter_dataset("classification")
+        )
 
         return {
             "total_samples": {
-                "classification": len(classification_data),
-                "similarity": len(similarity_data),
-                "ner": len(ner_data),
+                "classification": sum(label_counts.values()),
+                "similarity": _count(self._iter_dataset("similarity")),
+                "ner": _count(self._iter_dataset("ner")),
             },
             "function_groups": len(self.functiegroepen),
             "categories": len(set(fg.categorie for fg in self.functiegroepen.values())),
@@ -433,9 +727,6 @@ class HuggingFaceDataGenerator:
                 len(fg.certificeringen) for fg in self.functiegroepen.values()
             ),
             "label_distribution": {
-                fg_id: len(
-                    [item for item in classification_data if item["label"] == fg_id]
-                )
-                for fg_id in self.functiegroepen.keys()
+                fg_id: label_counts[fg_id] for fg_id in self.functiegroepen.keys()
             },
         }
@@ -6,11 +6,78 @@ AI-powered matching system for finding similar job profiles and generating
 cross-matching boolean searches based on skill overlap and similarity scoring.
 """
 
-from typing import Dict, List, Optional
+import json
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Dict, FrozenSet, Iterable, List, Optional, TextIO, Tuple
+
+import numpy as np
+
 from ..models import FunctieGroep
 from ..search import BooleanSearchGenerator
 
 
+def _set_jaccard(terms1: FrozenSet[str], terms2: FrozenSet[str]) -> float:
+    """
+    Jaccard index of two term sets, 0.0 if either set is empty.
+
+    Empty and disjoint pairs return before any intersection set is built.
+    """
+    if not terms1 or not terms2 or terms1.isdisjoint(terms2):
+        return 0.0
+    common = len(terms1 & terms2)
+    return common / (len(terms1) + len(terms2) - common)
+
+
+def _indicator_matrix(term_sets: List[Iterable[str]]) -> np.ndarray:
+    """
+    Build a 0/1 indicator matrix with one row per group and one column per term.
+
+    Args:
+        term_sets: One collection of (unique) terms per group
+
+    Returns:
+        Float matrix of shape (groups, distinct terms)
+    """
+    vocabulary: Dict[str, int] = {}
+    rows = [
+        [vocabulary.setdefault(term, len(vocabulary)) for term in terms]
+        for terms in term_sets
+    ]
+
+    indicator = np.zeros((len(rows), len(vocabulary)))
+    for i, columns in enumerate(rows):
+        indicator[i, columns] = 1.0
+
+    return indicator
+
+
+def _jaccard(indicator: np.ndarray, rows, columns=slice(None)) -> np.ndarray:
+    """
+    Compute the Jaccard index of the selected groups against other groups.
+
+    Intersection sizes are ``A[rows] @ A[columns].T``; union sizes follow
+    from the set sizes. Pairs where either set is empty score 0.0.
+
+    Args:
+        indicator: Indicator matrix from ``_indicator_matrix``
+        rows: Row selection (index list or slice) of the base groups
+        columns: Selection of the groups to compare against (default: all)
+
+    Returns:
+        Float matrix of shape (selected groups, compared groups)
+    """
+    sizes = indicator.sum(axis=1)
+    base_sizes = sizes[rows][:, None]
+    other_sizes = sizes[columns][None, :]
+
+    common = indicator[rows] @ indicator[columns].T
+    union = base_sizes + other_sizes - common
+    both = (base_sizes > 0) & (other_sizes > 0)
+
+    return np.divide(common, union, out=np.zeros_like(common), where=both)
+
+
 class LookAlikeMatcher:
     """
     Matcht profielen met vacatures en look-alike profielen.
@@ -21,15 +88,127 @@ class LookAlikeMatcher:
     3. Calculate similarity scores between job functions
     """
 
-    def __init__(self, functiegroepen: Dict[str, FunctieGroep]):
+    def __init__(
+        self,
+        functiegroepen: Dict[str, FunctieGroep],
+        search_generator: Optional[BooleanSearchGenerator] = None,
+    ):
         """
         Initialize with function groups database.
 
         Args:
             functiegroepen: Dictionary of function groups
+            search_generator: Existing generator for the same function groups
+                to share (and its caches); a new one is created if omitted
         """
         self.functiegroepen = functiegroepen
-        self.search_generator = BooleanSearchGenerator(functiegroepen)
+        if search_generator is None:
+            search_generator = BooleanSearchGenerator(functiegroepen)
+        self.search_generator = search_generator
+
+        # Memoized pairwise scores (keyed by group ids) and indicator
+        # matrices for vectorized similarity; not invalidated when a group's
+        # data changes (see clear_cache)
+        self._similarity_cache: Dict[Tuple[str, str], float] = {}
+        self._group_index: Optional[Dict[str, int]] = None
+        self._term_matrices: List[np.ndarray] = []
+        self._categories: Optional[np.ndarray] = None
+        self._term_indexes: List[Dict[str, List[int]]] = []
+        self._category_index: Dict[str, List[int]] = {}
+
+    def clear_cache(self) -> None:
+        """
+        Clear the cached similarity data.
+
+        Call this after modifying ``functiegroepen`` or the data of one of
+        the function groups.
+        """
+        self._similarity_cache.clear()
+        self.search_generator.clear_cache()
+        self._group_index = None
+        self._term_matrices = []
+        self._categories = None
+        self._term_indexes = []
+        self._category_index = {}
+
+    def _build_term_matrices(self) -> None:
+        """Build the indicator matrices for skills, certificeringen and sectors."""
+        groups = list(self.functiegroepen.values())
+
+        self._group_index = {fg_id: i for i, fg_id in enumerate(self.functiegroepen)}
+        self._term_matrices = [
+            _indicator_matrix([fg._skills_lc for fg in groups]),
+            _indicator_matrix([fg._certs_lc for fg in groups]),
+            _indicator_matrix([fg._sectors_lc for fg in groups]),
+        ]
+        self._categories = np.array([fg.categorie for fg in groups], dtype=object)
+
+        # Inverted indexes: term / categorie -> rijen van de functiegroepen
+        self._term_indexes = []
+        for attribute in ("_skills_lc", "_certs_lc", "_sectors_lc"):
+            index: Dict[str, List[int]] = {}
+            for i, fg in enumerate(groups):
+                for term in getattr(fg, attribute):
+                    index.setdefault(term, []).append(i)
+            self._term_indexes.append(index)
+
+        self._category_index = {}
+        for i, fg in enumerate(groups):
+            self._category_index.setdefault(fg.categorie, []).append(i)
+
+    def _similarity_scores(self, rows, columns=slice(None)) -> np.ndarray:
+        """
+        Compute unrounded similarity scores of the selected groups.
+
+        Same weighting as ``calculate_similarity``, before rounding.
+
+        Args:
+            rows: Row selection (index list or slice) of the base groups
+            columns: Selection of the groups to compare against (default: all)
+
+        Returns:
+            Float matrix of shape (selected groups, compared groups)
+        """
+        if self._group_index is None:
+            self._build_term_matrices()
+
+        skills, certs, sectors = self._term_matrices
+        categories = self._categories
+        same_category = categories[rows][:, None] == categories[columns][None, :]
+
+        score = (
+            _jaccard(skills, rows, columns) * 2
+            + _jaccard(certs, rows, columns)
+            + _jaccard(sectors, rows, columns)
+            + same_category
+        )
+        return score / 5.0
+
+    def _candidate_groups(self, fg: FunctieGroep) -> List[int]:
+        """
+        Find the groups that can score above zero against ``fg``.
+
+        Only groups sharing at least one skill, certification or sector
+        keyword, or the category, get a nonzero similarity score. They are
+        collected from the inverted indexes instead of scanning all groups.
+
+        Args:
+            fg: Base function group (from ``functiegroepen``)
+
+        Returns:
+            Sorted row indices of the candidate groups
+        """
+        if self._group_index is None:
+            self._build_term_matrices()
+
+        candidates = set(self._category_index.get(fg.categorie, ()))
+        for index, terms in zip(
+            self._term_indexes, (fg._skills_lc, fg._certs_lc, fg._sectors_lc)
+        ):
+            for term in terms:
+                candidates.update(index.get(term, ()))
+
+        return sorted(candidates)
 
     def get_lookalike_groups(self, fg_id: str) -> List[FunctieGroep]:
         """
@@ -75,41 +254,82 @@ class LookAlikeMatcher:
         look_alikes = self.get_lookalike_groups(fg_id)
 
         result = {
-            "primary_group": {
-                "id": fg.id,
-                "naam": fg.naam,
-                "searches": self.search_generator.generate_combined_search(fg),
-            },
+            "primary_group": self._primary_group_entry(fg),
             "lookalike_groups": [],
             "cross_match_searches": [],
         }
 
-        # Look-alike group searches
         for la_fg in look_alikes:
-            la_searches = self.search_generator.generate_combined_search(la_fg)
-            result["lookalike_groups"].append(
-                {
-                    "id": la_fg.id,
-                    "naam": la_fg.naam,
-                    "similarity_score": self.calculate_similarity(fg, la_fg),
-                    "searches": la_searches,
-                }
-            )
+            # Look-alike group searches
+            result["lookalike_groups"].append(self._lookalike_group_entry(fg, la_fg))
 
-        # Cross-match searches (combineer skills van beide groepen)
-        for la_fg in look_alikes:
-            cross_search = self._generate_cross_match_search(fg, la_fg)
-            result["cross_match_searches"].append(
-                {
-                    "primary": fg.id,
-                    "lookalike": la_fg.id,
-                    "boolean": cross_search,
-                    "description": f"Profielen met overlap tussen {fg.naam} en {la_fg.naam}",
-                }
-            )
+            # Cross-match searches (combineer skills van beide groepen)
+            result["cross_match_searches"].append(self._cross_match_entry(fg, la_fg))
 
         return result
 
+    def stream_lookalike_searches(self, fg_id: str, writer: TextIO) -> None:
+        """
+        Schrijft de look-alike searches als JSON naar een writer.
+
+        Writes the same document as ``json.dumps(generate_lookalike_searches(fg_id))``
+        but serializes each entry as soon as it is built, so the full result
+        is never held in memory and a response can start sending early.
+
+        Args:
+            fg_id: Primary function group ID
+            writer: Text stream with a ``write`` method (file, socket wrapper, ...)
+        """
+        if fg_id not in self.functiegroepen:
+            writer.write(json.dumps({"error": f"Functiegroep niet gevonden: {fg_id}"}))
+            return
+
+        fg = self.functiegroepen[fg_id]
+        look_alikes = self.get_lookalike_groups(fg_id)
+
+        writer.write('{"primary_group": ')
+        writer.write(json.dumps(self._primary_group_entry(fg)))
+
+        writer.write(', "lookalike_groups": [')
+        for i, la_fg in enumerate(look_alikes):
+            if i:
+                writer.write(", ")
+            writer.write(json.dumps(self._lookalike_group_entry(fg, la_fg)))
+
+        writer.write('], "cross_match_searches": [')
+        for i, la_fg in enumerate(look_alikes):
+            if i:
+                writer.write(", ")
+            writer.write(json.dumps(self._cross_match_entry(fg, la_fg)))
+
+        writer.write("]}")
+
+    def _primary_group_entry(self, fg: FunctieGroep) -> Dict:
+        """Build the ``primary_group`` entry of the look-alike searches."""
+        return {
+            "id": fg.id,
+            "naam": fg.naam,
+            "searches": self.search_generator.generate_combined_search(fg),
+        }
+
+    def _lookalike_group_entry(self, fg: FunctieGroep, la_fg: FunctieGroep) -> Dict:
+        """Build a ``lookalike_groups`` entry of the look-alike searches."""
+        return {
+            "id": la_fg.id,
+            "naam": la_fg.naam,
+            "similarity_score": self.calculate_similarity(fg, la_fg),
+            "searches": self.search_generator.generate_combined_search(la_fg),
+        }
+
+    def _cross_match_entry(self, fg: FunctieGroep, la_fg: FunctieGroep) -> Dict:
+        """Build a ``cross_match_searches`` entry of the look-alike searches."""
+        return {
+            "primary": fg.id,
+            "lookalike": la_fg.id,
+            "boolean": self._generate_cross_match_search(fg, la_fg),
+            "description": f"Profielen met overlap tussen {fg.naam} en {la_fg.naam}",
+        }
+
     def calculate_similarity(self, fg1: FunctieGroep, fg2: FunctieGroep) -> float:
         """
         Berekent similarity score tussen twee functiegroepen.
@@ -127,29 +347,36 @@ class LookAlikeMatcher:
         Returns:
             Similarity score between 0.0 and 1.0
         """
+        # Alleen functiegroepen uit de database worden gememoized; losse
+        # instanties kunnen dezelfde id met andere inhoud hebben
+        memoize = (
+            self.functiegroepen.get(fg1.id) is fg1
+            and self.functiegroepen.get(fg2.id) is fg2
+        )
+        if not memoize:
+            return self._compute_similarity(fg1, fg2)
+
+        # De score is symmetrisch: (a, b) en (b, a) delen één cache entry
+        key = (fg1.id, fg2.id) if fg1.id <= fg2.id else (fg2.id, fg1.id)
+        similarity = self._similarity_cache.get(key)
+        if similarity is None:
+            similarity = self._compute_similarity(fg1, fg2)
+            self._similarity_cache[key] = similarity
+        return similarity
+
+    def _compute_similarity(self, fg1: FunctieGroep, fg2: FunctieGroep) -> float:
+        """Compute the ``calculate_similarity`` score without memoization."""
         score = 0.0
         max_score = 5.0
 
         # Skill overlap (most important factor)
-        skills1 = set(s.lower() for s in fg1.skills)
-        skills2 = set(s.lower() for s in fg2.skills)
-        if skills1 and skills2:
-            skill_overlap = len(skills1 & skills2) / len(skills1 | skills2)
-            score += skill_overlap * 2  # Weight: 40%
+        score += _set_jaccard(fg1._skills_lc, fg2._skills_lc) * 2  # Weight: 40%
 
         # Certification overlap
-        certs1 = set(c.lower() for c in fg1.certificeringen)
-        certs2 = set(c.lower() for c in fg2.certificeringen)
-        if certs1 and certs2:
-            cert_overlap = len(certs1 & certs2) / len(certs1 | certs2)
-            score += cert_overlap  # Weight: 20%
+        score += _set_jaccard(fg1._certs_lc, fg2._certs_lc)  # Weight: 20%
 
         # Sector overlap
-        sectors1 = set(s.lower() for s in fg1.sector_keywords)
-        sectors2 = set(s.lower() for s in fg2.sector_keywords)
-        if sectors1 and sectors2:
-            sector_overlap = len(sectors1 & sectors2) / len(sectors1 | sectors2)
-            score += sector_overlap  # Weight: 20%
+        score += _set_jaccard(fg1._sectors_lc, fg2._sectors_lc)  # Weight: 20%
 
         # Same category bonus
         if fg1.categorie == fg2.categorie:
@@ -157,6 +384,25 @@ class LookAlikeMatcher:
 
         return round(score / max_score, 2)
 
+    def similarity_matrix(self) -> np.ndarray:
+        """
+        Berekent de similarity scores tussen alle paren functiegroepen.
+
+        Same scores as ``calculate_similarity``, computed for all pairs at
+        once from indicator-matrix products instead of pair-by-pair set
+        operations.
+
+        Returns:
+            Square matrix of similarity scores; rows and columns follow the
+            order of ``self.functiegroepen``
+        """
+        scores = self._similarity_scores(slice(None))
+
+        # Python's round, so the scores match calculate_similarity exactly
+        return np.array(
+            [[round(value, 2) for value in row] for row in scores.tolist()]
+        ).reshape(scores.shape)
+
     def find_similar_profiles(
         self, fg_id: str, similarity_threshold: float = 0.3
     ) -> List[Dict]:
@@ -173,28 +419,45 @@ class LookAlikeMatcher:
         if fg_id not in self.functiegroepen:
             return []
 
-        base_fg = self.functiegroepen[fg_id]
-        similar_profiles = []
+        if self._group_index is None:
+            self._build_term_matrices()
 
-        for other_id, other_fg in self.functiegroepen.items():
+        # Boven een drempel > 0 komen alleen groepen met een gedeelde term of
+        # dezelfde categorie in aanmerking; de rest scoort exact 0.0
+        base_fg = self.functiegroepen[fg_id]
+        if similarity_threshold > 0:
+            candidates = self._candidate_groups(base_fg)
+        else:
+            candidates = list(range(len(self._group_index)))
+
+        # Scores tegen alle kandidaten in één vectorized pass
+        rows = [self._group_index[fg_id]]
+        scores = self._similarity_scores(rows, candidates)[0].tolist()
+        items = list(self.functiegroepen.items())
+        matches = []
+
+        for i, score in zip(candidates, scores):
+            other_id, other_fg = items[i]
             if other_id == fg_id:
                 continue
 
-            similarity = self.calculate_similarity(base_fg, other_fg)
+            similarity = round(score, 2)
             if similarity >= similarity_threshold:
-                similar_profiles.append(
-                    {
-                        "id": other_fg.id,
-                        "naam": other_fg.naam,
-                        "categorie": other_fg.categorie,
-                        "similarity_score": similarity,
-                    }
-                )
-
-        # Sort by similarity score descending
-        return sorted(
-            similar_profiles, key=lambda x: x["similarity_score"], reverse=True
-        )
+                # Score in hele procenten als exacte integer sorteersleutel
+                matches.append((round(similarity * 100), similarity, other_fg))
+
+        # Sort by similarity score descending (stable for equal scores)
+        matches.sort(key=itemgetter(0), reverse=True)
+
+        return [
+            {
+                "id": other_fg.id,
+                "naam": other_fg.naam,
+                "categorie": other_fg.categorie,
+                "similarity_score": similarity,
+            }
+            for _, similarity, other_fg in matches
+        ]
 
     def generate_hybrid_search(
         self, primary_fg_id: str, secondary_fg_ids: List[str]
@@ -214,21 +477,22 @@ class LookAlikeMatcher:
 
         primary_fg = self.functiegroepen[primary_fg_id]
 
-        # Start with primary function group titles
-        all_titles = primary_fg.titels.copy()
-        combined_skills = set(primary_fg.skills)
+        # Start with primary function group titles; dicts as ordered sets keep
+        # the primary group's (ranked) terms first and the output deterministic
+        all_titles = dict.fromkeys(primary_fg.titels)
+        combined_skills = dict.fromkeys(primary_fg.skills)
 
         # Add titles and skills from secondary function groups
         for sec_id in secondary_fg_ids:
             if sec_id in self.functiegroepen:
                 sec_fg = self.functiegroepen[sec_id]
-                all_titles.extend(sec_fg.titels[:2])  # Top 2 titles only
-                combined_skills.update(sec_fg.skills[:10])  # Top 10 skills only
+                all_titles.update(dict.fromkeys(sec_fg._titels_top2))  # Top 2 only
+                combined_skills.update(dict.fromkeys(sec_fg._skills_top10))  # Top 10
 
         # Build the hybrid search
-        title_clause = self.search_generator._build_or_clause(list(set(all_titles)))
+        title_clause = self.search_generator._build_or_clause(list(all_titles))
         skill_clause = self.search_generator._build_or_clause(
-            list(combined_skills)[:15]
+            list(islice(combined_skills, 15))
         )
 
         return f"({title_clause}) AND ({skill_clause})"
@@ -247,15 +511,13 @@ class LookAlikeMatcher:
         Returns:
             Cross-match boolean search string
         """
-        # Combineer titels van beide groepen (top 3 each)
-        titles1 = fg1.titels[:3]
-        titles2 = fg2.titels[:3]
-        all_titles = list(set(titles1 + titles2))
+        # Combineer titels van beide groepen (top 3 each), ontdubbeld in volgorde
+        all_titles = list(dict.fromkeys(chain(fg1._titels_top3, fg2._titels_top3)))
 
-        # Gemeenschappelijke skills
-        skills1 = set(fg1.skills)
-        skills2 = set(fg2.skills)
-        common_skills = list(skills1 & skills2)
+        # Gemeenschappelijke skills, in de (rang)volgorde van fg1
+        common_skills = list(
+            dict.fromkeys(s for s in fg1.skills if s in fg2._skills_set)
+        )
 
         title_clause = self.search_generator._build_or_clause(all_titles)
 
@@ -266,6 +528,50 @@ class LookAlikeMatcher:
 
         return title_clause
 
+    def analyze_market_overlap_all(self) -> Dict:
+        """
+        Analyze market overlap between all pairs of function groups at once.
+
+        Batch version of ``analyze_market_overlap`` for heatmaps and
+        dashboards: overlap counts come from one indicator-matrix product per
+        attribute and the insight levels are derived with ``np.digitize``.
+
+        Returns:
+            Dictionary with the function group IDs (row/column order of all
+            matrices), the similarity matrix, overlap count matrices and
+            market insight level matrices
+        """
+        groups = list(self.functiegroepen.values())
+
+        def overlap_counts(attribute: str) -> np.ndarray:
+            indicator = _indicator_matrix(
+                [set(getattr(fg, attribute)) for fg in groups]
+            )
+            return (indicator @ indicator.T).astype(int)
+
+        counts = {
+            "skills": overlap_counts("skills"),
+            "certifications": overlap_counts("certificeringen"),
+            "employers": overlap_counts("typische_werkgevers"),
+            "competitors": overlap_counts("concurrenten"),
+        }
+
+        # Zelfde drempels als analyze_market_overlap (LOW / MEDIUM / HIGH)
+        levels = np.array(["LOW", "MEDIUM", "HIGH"])
+
+        return {
+            "function_groups": list(self.functiegroepen),
+            "similarity_scores": self.similarity_matrix(),
+            "overlap_counts": counts,
+            "market_insights": {
+                "talent_competition": levels[np.digitize(counts["employers"], [2, 4])],
+                "skill_transferability": levels[np.digitize(counts["skills"], [6, 11])],
+                "cross_training_potential": levels[
+                    np.digitize(counts["certifications"], [2, 4])
+                ],
+            },
+        }
+
     def analyze_market_overlap(self, fg1_id: str, fg2_id: str) -> Dict:
         """
         Analyze market overlap between two function groups.
@@ -284,10 +590,10 @@ class LookAlikeMatcher:
         fg2 = self.functiegroepen[fg2_id]
 
         # Calculate overlaps
-        skill_overlap = set(fg1.skills) & set(fg2.skills)
-        cert_overlap = set(fg1.certificeringen) & set(fg2.certificeringen)
-        employer_overlap = set(fg1.typische_werkgevers) & set(fg2.typische_werkgevers)
-        competitor_overlap = set(fg1.concurrenten) & set(fg2.concurrenten)
+        skill_overlap = fg1.get_unique_skills() & fg2.get_unique_skills()
+        cert_overlap = fg1._certs_set & fg2._certs_set
+        employer_overlap = fg1._employers_set & fg2._employers_set
+        competitor_overlap = fg1._competitors_set & fg2._competitors_set
 
         return {
             "function_groups": {
@@ -5,6 +5,11 @@ This package contains all data models and taxonomies used for boolean search gen
 """
 
 from .functiegroep import FunctieGroep
-from .taxonomie import FUNCTIEGROEPEN
+from .taxonomie import FUNCTIEGROEPEN, lookup_groups, lookup_groups_by_prefix
 
-__all__ = ["FunctieGroep", "FUNCTIEGROEPEN"]
+__all__ = [
+    "FunctieGroep",
+    "FUNCTIEGROEPEN",
+    "lookup_groups",
+    "lookup_groups_by_prefix",
+]
@@ -5,8 +5,34 @@ FunctieGroep Data Model
 Defines the core data structure for job function groups used in boolean search generation.
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional, Set
+import sys
+import unicodedata
+from functools import lru_cache
+from dataclasses import dataclass, fields
+from typing import FrozenSet, Iterable, Iterator, List, Dict, Optional, Tuple
+
+# Standaard senioriteitsniveaus van een functiegroep
+DEFAULT_SENIORITY_LEVELS = (
+    "junior",
+    "medior",
+    "senior",
+    "lead",
+    "hoofd",
+    "manager",
+)
+
+# Velden met termen; opgeslagen als (read-only) tuples
+_TERM_FIELDS = (
+    "titels",
+    "synoniemen",
+    "english_titles",
+    "skills",
+    "certificeringen",
+    "look_alikes",
+    "typische_werkgevers",
+    "concurrenten",
+    "sector_keywords",
+)
 
 
 @dataclass
@@ -38,62 +64,188 @@ class FunctieGroep:
     categorie: str  # engineering, productie, techniek, etc.
 
     # Kerntitels voor boolean search
-    titels: List[str] = field(default_factory=list)
+    titels: Tuple[str, ...] = ()
 
     # Synoniemen en variaties
-    synoniemen: List[str] = field(default_factory=list)
+    synoniemen: Tuple[str, ...] = ()
 
     # Engels equivalent
-    english_titles: List[str] = field(default_factory=list)
+    english_titles: Tuple[str, ...] = ()
 
     # Gerelateerde skills/tools
-    skills: List[str] = field(default_factory=list)
+    skills: Tuple[str, ...] = ()
 
     # Certificeringen/opleidingen
-    certificeringen: List[str] = field(default_factory=list)
+    certificeringen: Tuple[str, ...] = ()
 
     # Look-alike functiegroepen (ID's)
-    look_alikes: List[str] = field(default_factory=list)
+    look_alikes: Tuple[str, ...] = ()
 
     # Typische werkgevers/bedrijven in deze sector
-    typische_werkgevers: List[str] = field(default_factory=list)
+    typische_werkgevers: Tuple[str, ...] = ()
 
     # Concurrenten (voor competitor search)
-    concurrenten: List[str] = field(default_factory=list)
+    concurrenten: Tuple[str, ...] = ()
 
     # Senioriteitsniveaus
-    seniority_levels: List[str] = field(
-        default_factory=lambda: [
-            "junior",
-            "medior",
-            "senior",
-            "lead",
-            "hoofd",
-            "manager",
-        ]
-    )
+    seniority_levels: Tuple[str, ...] = DEFAULT_SENIORITY_LEVELS
 
     # Sector keywords
-    sector_keywords: List[str] = field(default_factory=list)
-
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for serialization."""
-        return asdict(self)
+    sector_keywords: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        """Intern the identifying strings and build the cached lookup sets."""
+        # Categorieën en niveaus komen vaak terug; geïnterneerd delen alle
+        # instanties één str-object en is vergelijken een pointer-check
+        self.id = sys.intern(self.id)
+        self.categorie = sys.intern(self.categorie)
+        self.seniority_levels = tuple(
+            sys.intern(level) for level in self.seniority_levels
+        )
+        self.refresh_cache()
+
+    def __setattr__(self, name: str, value) -> None:
+        """Rebuild the cached lookup data when a term field is reassigned."""
+        object.__setattr__(self, name, value)
+        # Tijdens __init__ bestaan de caches nog niet; __post_init__ bouwt ze
+        if name in _TERM_FIELDS and "_all_titles" in self.__dict__:
+            self.refresh_cache()
+
+    def refresh_cache(self) -> None:
+        """
+        Rebuild the cached lookup data used for matching and search building.
+
+        The term fields are read-only tuples (lists are converted). Assigning
+        a new sequence to a term field calls this method automatically.
+
+        Caches that other objects derive from the groups, such as the
+        memoized searches of BooleanSearchGenerator and the similarity
+        scores of LookAlikeMatcher, are not notified: call their
+        ``clear_cache()`` after changing a group.
+        """
+        # Termen als "VCA", "NEN1010" en "AutoCAD" komen in veel functiegroepen
+        # voor; geïnterneerd delen alle groepen één str-object per term.
+        # object.__setattr__, zodat dit niet opnieuw refresh_cache aanroept
+        for name in _TERM_FIELDS:
+            terms = tuple(map(sys.intern, getattr(self, name)))
+            object.__setattr__(self, name, _shared_terms(terms))
+
+        # Top-K selecties zoals gebruikt door cross-match en hybrid searches
+        self._titels_top2 = self.titels[:2]
+        self._titels_top3 = self.titels[:3]
+        self._skills_top10 = self.skills[:10]
+        self._skills_set = frozenset(self.skills)
+
+        # Sets voor membership-checks; de tuples bewaren de volgorde voor output
+        self._certs_set = frozenset(self.certificeringen)
+        self._employers_set = frozenset(self.typische_werkgevers)
+        self._competitors_set = frozenset(self.concurrenten)
+
+        # Geïnterneerd: gelijke termen in verschillende functiegroepen zijn
+        # hetzelfde object, dus set-doorsnedes vergelijken op identiteit
+        self._skills_lc = frozenset(_normalized(self.skills))
+        self._certs_lc = frozenset(_normalized(self.certificeringen))
+        self._sectors_lc = frozenset(_normalized(self.sector_keywords))
+
+        # Alle titels (titels, synoniemen, english_titles), origineel en
+        # genormaliseerd (zie normalize_term)
+        self._all_titles = self.titels + self.synoniemen + self.english_titles
+        self._all_titles_lc = tuple(_normalized(self._all_titles))
+        self._title_patterns = _minimal_substring_patterns(self._all_titles_lc)
+        self._sector_keywords_lc = tuple(_normalized(self.sector_keywords))
+
+    def to_dict(self, copy: bool = False) -> Dict:
+        """
+        Convert to dictionary for serialization.
+
+        Args:
+            copy: Return the term fields as new lists that the caller may
+                modify. By default the dictionary shares the (immutable)
+                tuples with this instance, which is enough for read-only use
+                such as JSON serialization.
+
+        Returns:
+            Dictionary with one entry per field
+        """
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        if copy:
+            for name, value in data.items():
+                if isinstance(value, tuple):
+                    data[name] = list(value)
+        return data
 
     def get_all_titles(self) -> List[str]:
         """Get all titles including synonyms and English titles."""
-        return self.titels + self.synoniemen + self.english_titles
+        return [*self.titels, *self.synoniemen, *self.english_titles]
 
-    def get_unique_skills(self) -> Set[str]:
-        """Get unique skills as a set."""
-        return set(self.skills)
+    def get_unique_skills(self) -> FrozenSet[str]:
+        """Get unique skills as a (shared, read-only) set."""
+        return self._skills_set
 
     def has_skill(self, skill: str) -> bool:
         """Check if this function group includes a specific skill."""
-        return skill.lower() in [s.lower() for s in self.skills]
+        return normalize_term(skill) in self._skills_lc
 
     def matches_title(self, title: str) -> bool:
         """Check if a given title matches any of this group's titles."""
-        title_lower = title.lower()
-        all_titles = self.get_all_titles()
-        return any(t.lower() in title_lower for t in all_titles)
+        title_lower = normalize_term(title)
+        return any(pattern in title_lower for pattern in self._title_patterns)
+
+
+def normalize_term(term: str) -> str:
+    """
+    Normalize a term or text for matching.
+
+    Casefolds, strips accents ("Coördinator" -> "coordinator") and collapses
+    whitespace. The taxonomy terms are normalized once in ``refresh_cache``;
+    user input is normalized the same way before it is compared.
+
+    Args:
+        term: Term or free text
+
+    Returns:
+        Normalized text
+    """
+    if term.isascii():
+        return " ".join(term.lower().split())
+    decomposed = unicodedata.normalize("NFKD", term.casefold())
+    return " ".join(
+        "".join(c for c in decomposed if not unicodedata.combining(c)).split()
+    )
+
+
+@lru_cache(maxsize=4096)
+def _shared_terms(terms: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Return one canonical tuple per distinct term tuple.
+
+    Groups with identical term lists (e.g. the same core titles) then share
+    a single tuple object, like ``sys.intern`` does for the strings.
+    """
+    return terms
+
+
+def _normalized(terms: Iterable[str]) -> Iterator[str]:
+    """Yield the terms normalized (see normalize_term) and interned."""
+    return (sys.intern(normalize_term(term)) for term in terms)
+
+
+def _minimal_substring_patterns(patterns: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Reduce patterns to the smallest set with the same substring matches.
+
+    A text contains some pattern exactly when it contains one of the result:
+    duplicates are dropped, as is every pattern that contains a shorter one
+    (a text containing "senior engineer" also contains "engineer").
+
+    Args:
+        patterns: Substring patterns
+
+    Returns:
+        Remaining patterns, shortest first
+    """
+    minimal: List[str] = []
+    for pattern in sorted(set(patterns), key=len):
+        if not any(shorter in pattern for shorter in minimal):
+            minimal.append(pattern)
+    return tuple(minimal)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Functiegroep Taxonomie Database
+
+Contains the complete database of function groups used for boolean search generation.
+This includes all job titles, synonyms, skills, certifications, and related data
+for various technical recruitment categories.
+
+The function groups are defined per category in the submodules of this package;
+a submodule is only imported when one of its function groups is first used.
+"""
+
+from bisect import bisect_left
+from collections.abc import Mapping
+from functools import lru_cache
+from importlib import import_module
+from typing import Dict, Iterator, List, Tuple
+
+from ..functiegroep import FunctieGroep, normalize_term
+
+
+class _LazyFunctiegroepen(Mapping):
+    """
+    Read-only mapping van functiegroep-ID naar FunctieGroep.
+
+    Elke functiegroep wordt pas bij de eerste opvraging aangemaakt door de
+    builder in zijn categorie-submodule (die dan pas wordt geïmporteerd) en
+    daarna hergebruikt, zodat herhaalde lookups hetzelfde object opleveren.
+    Iteratie volgt de volgorde van de tabel.
+    """
+
+    def __init__(self, modules: Dict[str, str]):
+        """
+        Args:
+            modules: Functiegroep-ID -> naam van de submodule met zijn builder
+        """
+        self._modules = modules
+        self._cache: Dict[str, FunctieGroep] = {}
+
+    def __getitem__(self, key: str) -> FunctieGroep:
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        module = import_module(f"{__name__}.{self._modules[key]}")
+        fg = module.BUILDERS[key]()
+        # setdefault: bij gelijktijdige eerste opvraging wint één instantie
+        return self._cache.setdefault(key, fg)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._modules
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._modules)})"
+
+
+FUNCTIEGROEPEN: Mapping = _LazyFunctiegroepen(
+    {
+        "werkvoorbereider_elektro": "werkvoorbereiding",
+        "werkvoorbereider_installatie": "werkvoorbereiding",
+        "calculator_bouw": "werkvoorbereiding",
+        "software_engineer": "software",
+        "monteur_elektro": "techniek",
+        "monteur_installatie": "techniek",
+        "servicemonteur": "techniek",
+        "mechatronicus": "techniek",
+        "plc_programmeur": "automatisering",
+        "projectleider_elektro": "projectleiding",
+        "projectleider_installatie": "projectleiding",
+        "constructeur": "engineering",
+    }
+)
+
+
+@lru_cache(maxsize=None)
+def _term_index() -> Dict[str, Tuple[str, ...]]:
+    """
+    Bouwt eenmalig de inverted index van genormaliseerde term naar
+    functiegroep-ID's.
+
+    Geïndexeerd worden titels, synoniemen, Engelse titels, skills en sector
+    keywords. De ID's staan in de volgorde van FUNCTIEGROEPEN.
+    """
+    index: Dict[str, Dict[str, None]] = {}
+    for fg_id, fg in FUNCTIEGROEPEN.items():
+        for term in (*fg._all_titles_lc, *fg._skills_lc, *fg._sectors_lc):
+            index.setdefault(term, {})[fg_id] = None
+    return {term: tuple(ids) for term, ids in index.items()}
+
+
+def lookup_groups(term: str) -> List[str]:
+    """
+    Zoekt de functiegroepen waarin een term exact voorkomt.
+
+    Args:
+        term: Titel, skill of sector keyword (hoofdletter- en
+            accentongevoelig, zie normalize_term)
+
+    Returns:
+        List of functiegroep IDs containing the term
+    """
+    return list(_term_index().get(normalize_term(term), ()))
+
+
+@lru_cache(maxsize=None)
+def _sorted_terms() -> Tuple[str, ...]:
+    """Alle geïndexeerde termen, gesorteerd voor prefix-zoekopdrachten."""
+    return tuple(sorted(_term_index()))
+
+
+def lookup_groups_by_prefix(prefix: str) -> List[str]:
+    """
+    Zoekt de functiegroepen met een term die met ``prefix`` begint.
+
+    Termen met dezelfde prefix liggen aaneengesloten in de gesorteerde
+    termenlijst; een binary search vindt de eerste, zodat alleen de
+    treffers worden bekeken ("siemens" vindt ook "siemens s7-1500").
+
+    Args:
+        prefix: Begin van een titel, skill of sector keyword (hoofdletter- en
+            accentongevoelig, zie normalize_term)
+
+    Returns:
+        List of functiegroep IDs, in the order of FUNCTIEGROEPEN
+    """
+    prefix = normalize_term(prefix)
+    if not prefix:
+        return list(FUNCTIEGROEPEN)
+    terms = _sorted_terms()
+    index = _term_index()
+    found = set()
+    for i in range(bisect_left(terms, prefix), len(terms)):
+        if not terms[i].startswith(prefix):
+            break
+        found.update(index[terms[i]])
+    return [fg_id for fg_id in FUNCTIEGROEPEN if fg_id in found]
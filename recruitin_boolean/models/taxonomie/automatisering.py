@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Functiegroepen: Industriële automatisering
+"""
+
+from typing import Callable, Dict
+
+from ..functiegroep import FunctieGroep
+
+
+def _build_plc_programmeur() -> FunctieGroep:
+    return FunctieGroep(
+        id="plc_programmeur",
+        naam="PLC Programmeur",
+        categorie="automatisering",
+        titels=("PLC Programmeur", "PLC Engineer", "Automation Engineer"),
+        synoniemen=(
+            # Basis titels
+            "PLC Programmeur", "PLC Engineer", "Besturingstechnicus",
+            "Automation Engineer", "Control System Engineer",
+            "Software Engineer PLC", "SCADA Engineer",
+            # Seniority variaties
+            "Senior PLC Programmeur", "Junior PLC Programmeur", "Medior PLC Programmeur",
+            "Lead PLC Engineer", "Principal Automation Engineer",
+            # Specialisaties per merk
+            "Siemens PLC Programmeur", "Allen Bradley Programmeur", "Beckhoff Programmeur",
+            "Omron Programmeur", "Mitsubishi PLC Programmeur", "Codesys Programmeur",
+            # SCADA/DCS variaties
+            "SCADA Specialist", "DCS Engineer", "DCS Programmeur",
+            "MES Engineer", "MES Specialist", "Historian Engineer",
+            # Hybride titels
+            "Controls Engineer", "Besturingssysteem Engineer", "Control Specialist",
+            "Industrial Automation Engineer", "ICS Engineer",
+            "Automation Specialist", "Automatiserings Ingenieur",
+            # HMI/Visualisatie
+            "HMI Programmeur", "HMI Developer", "Visualisatie Specialist",
+            "WinCC Programmeur", "Ignition Developer"
+        ),
+        english_titles=(
+            "PLC Programmer", "Automation Engineer", "Control Systems Engineer",
+            "Controls Engineer", "Industrial Automation Engineer", "SCADA Developer",
+            "DCS Engineer", "MES Engineer", "Senior PLC Programmer",
+            "Automation Specialist", "Process Control Engineer"
+        ),
+        skills=(
+            # Siemens ecosystem
+            "Siemens TIA Portal", "Step 7", "Siemens S7-1200", "Siemens S7-1500",
+            "Siemens S7-300", "Siemens S7-400", "WinCC", "WinCC OA", "WinCC Unified",
+            # Allen Bradley / Rockwell
+            "Allen Bradley", "Rockwell", "Studio 5000", "RSLogix",
+            "ControlLogix", "CompactLogix", "MicroLogix", "FactoryTalk",
+            # Andere PLC merken
+            "Codesys", "Beckhoff TwinCAT", "Omron", "Mitsubishi", "Schneider",
+            "Simatic", "ABB PLC", "B&R Automation", "Phoenix Contact",
+            # SCADA / DCS
+            "SCADA", "Ignition", "Wonderware", "InTouch", "iFIX", "Citect",
+            "DCS", "Emerson DeltaV", "Yokogawa", "Honeywell Experion",
+            "ABB 800xA", "PI Historian", "OSIsoft",
+            # HMI
+            "HMI", "Comfort Panel", "AVEVA", "Proface", "Beijer",
+            # Communicatie
+            "Profinet", "Profibus", "EtherCAT", "Modbus", "OPC-UA", "MQTT",
+            "Ethernet/IP", "DeviceNet", "CANopen",
+            # Software
+            "IEC 61131-3", "Structured Text", "Ladder Logic", "FBD",
+            "Python", "SQL", "C#", "VB.NET"
+        ),
+        certificeringen=(
+            # Siemens
+            "Siemens TIA Portal certificaat", "Siemens SITRAIN",
+            "Siemens Certified Professional", "Siemens S7 certificaat",
+            # Rockwell
+            "Rockwell certificaat", "Allen Bradley certificaat",
+            "FactoryTalk certificaat",
+            # SCADA
+            "Ignition certificaat", "Wonderware certificaat",
+            # Veiligheid
+            "TÜV Functional Safety", "SIL certificaat", "IEC 61508",
+            "VCA VOL", "VCA Basis", "NEN3140",
+            # Opleidingen
+            "HBO Elektrotechniek", "HBO Technische Informatica",
+            "MBO Elektrotechniek niveau 4", "Certified Automation Professional"
+        ),
+        look_alikes=("mechatronicus", "automatiseringsengineer", "software_engineer"),
+        typische_werkgevers=(
+            "Siemens", "ABB", "Yokogawa", "Honeywell"
+        ),
+        concurrenten=(
+            "Siemens", "ABB", "Yokogawa", "Honeywell", "Emerson", "Schneider"
+        ),
+        sector_keywords=(
+            "PLC", "automatisering", "besturing", "SCADA", "DCS",
+            "controls", "industrial automation", "process control", "ICS"
+        )
+    )
+
+
+BUILDERS: Dict[str, Callable[[], FunctieGroep]] = {
+    "plc_programmeur": _build_plc_programmeur,
+}
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Functiegroepen: Engineering & constructie
+"""
+
+from typing import Callable, Dict
+
+from ..functiegroep import FunctieGroep
+
+
+def _build_constructeur() -> FunctieGroep:
+    return FunctieGroep(
+        id="constructeur",
+        naam="Constructeur / Mechanical Engineer",
+        categorie="engineering",
+        titels=("Constructeur", "Mechanical Engineer", "Design Engineer"),
+        synoniemen=(
+            # === BASIS TITELS ===
+            "Constructeur", "Mechanical Designer", "3D Constructeur",
+            "Productontwerper", "CAD Engineer", "Design Engineer",
+            "Werktuigbouwkundig Constructeur", "Tekenaar Constructeur",
+            # === SENIORITY LEVELS ===
+            "Senior Constructeur", "Junior Constructeur", "Medior Constructeur",
+            "Lead Constructeur", "Hoofd Constructeur", "Principal Engineer",
+            "Senior Mechanical Designer", "Junior Mechanical Designer",
+            # === SPECIALISATIES ===
+            "SolidWorks Constructeur", "Inventor Constructeur", "Creo Constructeur",
+            "CATIA Constructeur", "NX Constructeur", "Siemens NX Designer",
+            "Machinebouwer", "Machine Designer", "Machineconstructeur",
+            "Apparatenbouwer", "Equipment Designer", "Tooling Engineer",
+            "Jig & Fixture Designer", "Matrijzenmaker", "Mold Designer",
+            "Staalconstructeur", "Steel Designer", "Staalbouwconstructeur",
+            "Scheepsbouwkundig Constructeur", "Marine Designer",
+            # === ANALYSE & BEREKENING ===
+            "FEM Analist", "FEA Engineer", "Structural Analyst",
+            "Sterkteberekening Engineer", "Stress Engineer", "Stress Analyst",
+            "Simulatie Engineer", "CFD Engineer", "Thermisch Analist",
+            # === PRODUCT DEVELOPMENT ===
+            "Product Developer", "Productontwikkelaar", "R&D Engineer",
+            "Development Engineer", "Concept Engineer", "Innovation Engineer"
+        ),
+        english_titles=(
+            "Mechanical Engineer", "Mechanical Designer", "Design Engineer",
+            "CAD Designer", "CAD Engineer", "Product Designer",
+            "Senior Mechanical Engineer", "Junior Mechanical Engineer",
+            "Machine Designer", "Equipment Engineer", "Tooling Engineer",
+            "Structural Engineer", "FEA Engineer", "Stress Analyst",
+            "R&D Engineer", "Development Engineer", "Product Developer"
+        ),
+        skills=(
+            # === CAD SOFTWARE ===
+            "SolidWorks", "Inventor", "Autodesk Inventor", "Creo", "PTC Creo",
+            "CATIA", "CATIA V5", "CATIA V6", "Siemens NX", "NX", "Unigraphics",
+            "AutoCAD", "AutoCAD Mechanical", "Solid Edge", "FreeCAD",
+            "Fusion 360", "Onshape", "SpaceClaim",
+            # === 3D MODELLEREN ===
+            "3D modelleren", "3D modeling", "parametrisch ontwerpen",
+            "sheet metal", "plaatwerk ontwerp", "weldments", "lasconstructies",
+            "surfacing", "surface modeling", "assemblage ontwerp",
+            # === ANALYSE & SIMULATIE ===
+            "FEM", "FEA", "Finite Element Analysis", "eindige elementen",
+            "sterkteberekening", "stress analysis", "fatigue analysis",
+            "SolidWorks Simulation", "ANSYS", "ABAQUS", "Nastran", "MSC Nastran",
+            "CFD", "thermische analyse", "modal analysis", "topology optimization",
+            # === ENGINEERING STANDAARDEN ===
+            "GD&T", "Geometric Dimensioning", "tolerantie analyse",
+            "DIN", "ISO", "EN normen", "ASME Y14.5",
+            "engineering change management", "ECN", "PLM",
+            # === PDM/PLM ===
+            "PDM", "PLM", "Teamcenter", "Windchill", "Vault", "ENOVIA",
+            "SolidWorks PDM", "product data management", "BOM management",
+            # === MATERIALEN & PRODUCTIE ===
+            "materiaalkunde", "staal", "aluminium", "RVS", "kunststoffen",
+            "composieten", "DFM", "Design for Manufacturing", "DFMA",
+            "rapid prototyping", "3D printen", "additive manufacturing"
+        ),
+        certificeringen=(
+            # === SOLIDWORKS ===
+            "SolidWorks CSWA", "CSWP", "CSWE", "SolidWorks CSWP",
+            "SolidWorks certificaat", "Certified SolidWorks Associate",
+            "Certified SolidWorks Professional", "Certified SolidWorks Expert",
+            "CSWPA-SM", "CSWPA-WD", "CSWPA-SU",
+            # === AUTODESK ===
+            "Autodesk Certified Professional", "Autodesk Inventor Certified",
+            "AutoCAD certificaat", "Fusion 360 certificaat",
+            # === CATIA/NX ===
+            "CATIA certificaat", "Siemens NX certificaat", "Creo certificaat",
+            # === OPLEIDINGEN ===
+            "HBO Werktuigbouwkunde", "MBO Werktuigbouwkunde",
+            "HBO Mechanical Engineering", "BSc Mechanical Engineering",
+            "MSc Mechanical Engineering", "TU Delft", "TU Eindhoven",
+            "HTS Werktuigbouwkunde", "Ingenieur", "Ir.", "ing.",
+            # === AANVULLEND ===
+            "VCA VOL", "VCA Basis", "PRINCE2", "Six Sigma Green Belt"
+        ),
+        look_alikes=("tekenaar_constructeur", "werktuigbouwer", "productontwerper"),
+        typische_werkgevers=(
+            "VDL", "ASML", "Philips", "DAF", "Fokker"
+        ),
+        concurrenten=(
+            "VDL", "ASML", "Philips", "DAF", "Fokker", "Thales"
+        ),
+        sector_keywords=("werktuigbouw", "mechanical", "constructie", "productie", "machinebouw", "R&D")
+    )
+
+
+BUILDERS: Dict[str, Callable[[], FunctieGroep]] = {
+    "constructeur": _build_constructeur,
+}
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Functiegroepen: Projectleiding
+"""
+
+from typing import Callable, Dict
+
+from ..functiegroep import FunctieGroep
+
+# Gedeelde blokken van alle projectleider-functiegroepen
+_PM_SKILLS = (
+    "Projectmanagement", "MS Project", "Primavera", "Planon",
+    "Budgetbeheer", "Kostenbeheersing", "Risicomanagement",
+    "Stakeholder Management", "Contractmanagement",
+)
+
+_SOFT_SKILLS = (
+    "Leidinggeven", "Teammanagement", "Klantcontact",
+    "Onderhandelen", "Rapportage", "Presenteren",
+)
+
+_PM_CERTIFICERINGEN = (
+    "Prince2 Foundation", "Prince2 Practitioner",
+    "PMP", "PMI certificaat", "IPMA-D", "IPMA-C", "IPMA-B",
+    "Lean Six Sigma Green Belt", "Lean Six Sigma Black Belt",
+)
+
+
+def _build_projectleider_elektro() -> FunctieGroep:
+    return FunctieGroep(
+        id="projectleider_elektro",
+        naam="Projectleider Elektrotechniek",
+        categorie="projectleiding",
+        titels=("Projectleider", "Project Manager", "Projectmanager"),
+        synoniemen=(
+            # Basis titels
+            "Projectleider Elektrotechniek", "Projectmanager E-techniek",
+            "Technisch Projectleider", "Project Engineer Elektro",
+            # Seniority variaties
+            "Senior Projectleider E-techniek", "Junior Projectleider Elektro",
+            "Medior Projectleider Elektrotechniek", "Lead Projectleider",
+            # Specialisaties
+            "Projectleider Laagspanning", "Projectleider Middenspanning",
+            "Projectleider Hoogspanning", "Projectleider Energie",
+            "Projectleider Data", "Projectleider Telecom",
+            "Projectleider Utiliteit", "Projectleider Industrie",
+            # Hybride titels
+            "Uitvoerder E-techniek", "Uitvoerder Elektro",
+            "Coördinator E-techniek", "Teamleider E-techniek",
+            "Projectcoördinator Elektro", "Hoofduitvoerder E-techniek",
+            # Technische projectleiding
+            "Technical Project Manager E-techniek", "E&I Projectleider",
+            "Projectleider E&I", "Projectleider Besturingstechniek",
+            "Projectleider Installatie Elektro", "Projectleider Netwerken"
+        ),
+        english_titles=(
+            "Project Manager", "Project Leader", "Project Engineer",
+            "Electrical Project Manager", "Technical Project Manager",
+            "Senior Project Manager", "E&I Project Manager",
+            "Project Manager Electrical", "Construction Project Manager"
+        ),
+        skills=_PM_SKILLS + (
+            # Technisch
+            "Elektrotechniek", "EPLAN", "AutoCAD Electrical", "Revit MEP",
+            "Laagspanning", "Middenspanning", "Hoogspanning",
+            "NEN1010", "NEN3140", "NEN-EN-IEC normering"
+        ) + _SOFT_SKILLS,
+        certificeringen=_PM_CERTIFICERINGEN + (
+            "Agile certificaat", "Scrum Master",
+            # Technisch
+            "NEN3140 VOP", "NEN3140 VP", "VCA VOL", "VCA Basis",
+            # Opleidingen
+            "HBO Elektrotechniek", "HBO Technische Bedrijfskunde",
+            "MBO Elektrotechniek niveau 4", "MBO Middenkaderopleiding"
+        ),
+        look_alikes=("projectleider_installatie", "projectleider_bouw", "werkvoorbereider_elektro"),
+        typische_werkgevers=(
+            "Unica", "Croonwolter&dros", "Hoppenbrouwers", "Spie"
+        ),
+        concurrenten=(
+            "Strukton", "Heijmans", "BAM", "Engie", "Imtech"
+        ),
+        sector_keywords=(
+            "elektrotechniek", "E-techniek", "elektro", "utiliteit",
+            "industrie", "infra", "energie", "power"
+        )
+    )
+
+
+def _build_projectleider_installatie() -> FunctieGroep:
+    return FunctieGroep(
+        id="projectleider_installatie",
+        naam="Projectleider Installatietechniek",
+        categorie="projectleiding",
+        titels=("Projectleider", "Project Manager", "Projectmanager"),
+        synoniemen=(
+            # Basis titels
+            "Projectleider Installatietechniek", "Projectmanager W-techniek",
+            "Projectleider HVAC", "Project Engineer Installatie",
+            # Seniority variaties
+            "Senior Projectleider W-techniek", "Junior Projectleider Installatie",
+            "Medior Projectleider HVAC", "Lead Projectleider Installatie",
+            # Specialisaties
+            "Projectleider Klimaat", "Projectleider Koeling",
+            "Projectleider Warmtepompen", "Projectleider Duurzame Energie",
+            "Projectleider Sanitair", "Projectleider Sprinkler",
+            "Projectleider Utiliteit W", "Projectleider Industrie W",
+            # Hybride titels
+            "Uitvoerder W-techniek", "Uitvoerder Installatie",
+            "Coördinator W-techniek", "Teamleider Installatie",
+            "Projectcoördinator Installatie", "Hoofduitvoerder W-techniek",
+            # MEP titels
+            "Projectleider MEP", "MEP Projectmanager", "MEP Coördinator",
+            "Projectleider Building Services", "Technical Project Manager MEP"
+        ),
+        english_titles=(
+            "Project Manager MEP", "HVAC Project Manager", "Mechanical Project Manager",
+            "MEP Project Manager", "Building Services Project Manager",
+            "Senior Project Manager HVAC", "Project Leader Installations",
+            "Project Engineer MEP", "Construction Project Manager MEP"
+        ),
+        skills=_PM_SKILLS + (
+            # Technisch HVAC
+            "HVAC", "Klimaattechniek", "Koeltechniek", "Warmtepompen",
+            "Ventilatie", "Luchtbehandeling", "Gebouwautomatisering",
+            # Software
+            "Revit MEP", "AutoCAD MEP", "Stabicad", "DDS-CAD",
+            "BIM", "Solibri", "Navisworks"
+        ) + _SOFT_SKILLS,
+        certificeringen=_PM_CERTIFICERINGEN + (
+            # Technisch
+            "F-gassen certificaat", "STEK certificaat", "EPBD certificaat",
+            "VCA VOL", "VCA Basis",
+            # Opleidingen
+            "HBO Installatietechniek", "HBO Technische Bedrijfskunde",
+            "HBO Klimaattechniek", "MBO Installatie niveau 4"
+        ),
+        look_alikes=("projectleider_elektro", "projectleider_bouw", "werkvoorbereider_installatie"),
+        typische_werkgevers=(
+            "Kuijpers", "Breman", "Unica", "Aalberts"
+        ),
+        concurrenten=(
+            "Strukton", "Heijmans", "Croonwolter&dros"
+        ),
+        sector_keywords=(
+            "installatietechniek", "HVAC", "klimaat", "W-techniek",
+            "MEP", "utiliteit", "building services", "duurzaam"
+        )
+    )
+
+
+BUILDERS: Dict[str, Callable[[], FunctieGroep]] = {
+    "projectleider_elektro": _build_projectleider_elektro,
+    "projectleider_installatie": _build_projectleider_installatie,
+}
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Functiegroepen: Software development
+"""
+
+from typing import Callable, Dict
+
+from ..functiegroep import FunctieGroep
+
+
+def _build_software_engineer() -> FunctieGroep:
+    return FunctieGroep(
+        id="software_engineer",
+        naam="Software Engineer / Developer",
+        categorie="software",
+        titels=("Software Engineer", "Developer", "Software Developer", "Programmer"),
+        synoniemen=(
+            "Software Engineer",
+            "Software Developer",
+            "Developer",
+            "Programmer",
+            "Softwareontwikkelaar",
+            "Application Developer",
+            "Full Stack Developer",
+            "Frontend Developer",
+            "Backend Developer",
+            "Web Developer",
+            "Mobile Developer",
+            "Cloud Developer",
+            "Junior Developer",
+            "Medior Developer",
+            "Senior Developer",
+            "Lead Developer",
+            "Software Architect",
+            "Technical Lead",
+            "Senior Software Engineer",
+            "Staff Engineer",
+            "Principal Engineer",
+            "Tech Lead",
+            "Embedded Engineer",
+            "Cloud Engineer",
+            "DevOps Engineer",
+            "Platform Engineer",
+            "SRE",
+            "Data Engineer",
+            "ML Engineer",
+            "AI Engineer",
+        ),
+        english_titles=(
+            "Software Engineer",
+            "Software Developer",
+            "Full Stack Developer",
+            "Frontend Developer",
+            "Backend Developer",
+            "Web Developer",
+            "Mobile Developer",
+            "Cloud Engineer",
+            "DevOps Engineer",
+            "Senior Software Engineer",
+            "Staff Engineer",
+            "Principal Engineer",
+            "Tech Lead",
+            "Embedded Engineer",
+            "Cloud Engineer",
+            "DevOps Engineer",
+            "Platform Engineer",
+            "SRE",
+            "Data Engineer",
+            "ML Engineer",
+            "AI Engineer",
+        ),
+        skills=(
+            "Python",
+            "Java",
+            "C++",
+            "C#",
+            ".NET",
+            "Go",
+            "Rust",
+            "JavaScript",
+            "TypeScript",
+            "Node.js",
+            "PHP",
+            "Ruby",
+            "Scala",
+            "Kotlin",
+            "C",
+            "Embedded C",
+            "Assembly",
+            "Spring",
+            "Spring Boot",
+            "Django",
+            "Flask",
+            "FastAPI",
+            "Express.js",
+            "NestJS",
+            "ASP.NET",
+            "Ruby on Rails",
+            "React",
+            "Angular",
+            "Vue.js",
+            "Next.js",
+            "Svelte",
+            "Redux",
+            "GraphQL",
+            "REST API",
+            "AWS",
+            "Azure",
+            "Google Cloud",
+            "GCP",
+            "Docker",
+            "Kubernetes",
+            "Terraform",
+            "Ansible",
+            "Jenkins",
+            "GitLab CI",
+            "GitHub Actions",
+            "CI/CD",
+            "PostgreSQL",
+            "MySQL",
+            "MongoDB",
+            "Redis",
+            "Elasticsearch",
+            "Kafka",
+            "RabbitMQ",
+            "SQL",
+            "NoSQL",
+            "Database design",
+            "Git",
+            "Agile",
+            "Scrum",
+            "Kanban",
+            "TDD",
+            "Unit testing",
+            "Integration testing",
+            "Microservices",
+            "API design",
+            "System design",
+            "RTOS",
+            "FreeRTOS",
+            "Linux kernel",
+            "Device drivers",
+            "ARM",
+            "STM32",
+            "ESP32",
+            "Raspberry Pi",
+        ),
+        certificeringen=(
+            "AWS Certified",
+            "AWS Solutions Architect",
+            "AWS Developer",
+            "Azure Certified",
+            "Azure Developer",
+            "Azure Administrator",
+            "Google Cloud Certified",
+            "GCP Professional",
+            "Scrum Master",
+            "PSM",
+            "PSPO",
+            "SAFe",
+            "Agile Coach",
+            "Oracle Java Certified",
+            "Microsoft Certified",
+            "Kubernetes Certified",
+            "CKA",
+            "CKAD",
+            "Docker Certified",
+            "Terraform Certified",
+            "HBO Informatica",
+            "HBO Software Engineering",
+            "MSc Computer Science",
+            "BSc Informatica",
+            "TU Delft",
+            "TU Eindhoven",
+            "Universiteit",
+        ),
+        look_alikes=("plc_programmeur", "embedded_engineer", "data_engineer"),
+        typische_werkgevers=("ASML", "Philips", "TomTom", "Booking", "Adyen"),
+        concurrenten=("ASML", "Philips", "TomTom", "Booking", "Adyen", "Exact"),
+        sector_keywords=(
+            "software",
+            "IT",
+            "development",
+            "programmeren",
+            "tech",
+            "digital",
+        ),
+    )
+
+
+BUILDERS: Dict[str, Callable[[], FunctieGroep]] = {
+    "software_engineer": _build_software_engineer,
+}
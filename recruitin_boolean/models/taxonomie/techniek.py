@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Functiegroepen: Techniek: monteurs en mechatronica
+"""
+
+from typing import Callable, Dict
+
+from ..functiegroep import FunctieGroep
+
+
+def _build_monteur_elektro() -> FunctieGroep:
+    return FunctieGroep(
+        id="monteur_elektro",
+        naam="Monteur Elektrotechniek",
+        categorie="techniek",
+        titels=("Monteur", "Elektromonteur", "Servicemonteur", "Technicus"),
+        synoniemen=(
+            "Elektromonteur", "Monteur Elektrotechniek", "E-Monteur",
+            "Servicemonteur Elektro", "Onderhoudsmonteur Elektro",
+            "Eerste Monteur Elektro", "Allround Elektromonteur",
+            "Senior Elektromonteur", "Junior Elektromonteur", "Medior Elektromonteur",
+            "Elektrotechnisch Monteur", "Industrieel Elektromonteur",
+            "Elektromonteur Laagspanning", "Elektromonteur Middenspanning",
+            "Elektromonteur Sterkstroom", "Elektromonteur Zwakstroom",
+            "Elektromonteur Utiliteit", "Elektromonteur Woningbouw",
+            "Elektromonteur Nieuwbouw", "Elektromonteur Onderhoud",
+            "Monteur E&I", "E&I Monteur", "Monteur Elektrisch",
+            "Schakelaar Monteur", "Installateur Elektro", "Storingsmonteur Elektro",
+            "Aankomend Elektromonteur", "1e Elektromonteur", "2e Elektromonteur",
+            "Elektricien", "Installatiemonteur Elektro", "Technicus Elektrotechniek",
+            "Voorkeur Vakman Elektro", "VOP Monteur", "VP Monteur",
+            "Elektromonteur Industrie", "Elektromonteur Scheepvaart"
+        ),
+        english_titles=(
+            "Electrician", "Electrical Technician", "Service Electrician",
+            "Industrial Electrician", "Maintenance Electrician", "Installation Electrician",
+            "Electrical Installer", "Electrical Fitter", "E&I Technician"
+        ),
+        skills=(
+            "elektrotechniek", "NEN1010", "NEN3140", "storingsdienst",
+            "PLC", "laagspanning", "middenspanning", "installatietechniek",
+            "schakelaarinstallaties", "kabelwerk", "bekabeling",
+            "verdeelkasten", "lichtinstallaties", "noodverlichting",
+            "brandmeldinstallaties", "domotica", "KNX", "gebouwautomatisering",
+            "frequentieregelaars", "softstarters", "motorbesturing",
+            "aardingssystemen", "bliksembeveiliging", "overspanningsbeveiliging",
+            "tekeningen lezen", "installatietekeningen", "schema's lezen",
+            "metingen", "isolatiemeting", "aardingsmeting",
+            "ploegendienst", "storingswacht", "24-uurs service"
+        ),
+        certificeringen=(
+            "NEN3140 VOP", "NEN3140 VP", "NEN3140", "VCA VOL", "VCA Basis",
+            "NEN1010", "STIPEL BEI-IV", "STIPEL BEI-VP", "STIPEL BEI-VOP",
+            "MBO Elektrotechniek niveau 2", "MBO Elektrotechniek niveau 3",
+            "MBO Elektrotechniek niveau 4", "MBO Eerste Monteur Elektrotechnische Installaties",
+            "MBO Monteur Elektrotechnische Installaties", "BOL Elektrotechniek",
+            "BBL Elektrotechniek", "Kenteq E-certificaat"
+        ),
+        look_alikes=("monteur_installatie", "servicemonteur", "onderhoudsmonteur", "mechatronicus"),
+        typische_werkgevers=(
+            "Unica", "Croonwolter&dros", "Hoppenbrouwers", "Spie", "Engie",
+            "Equans", "Cofely", "Imtech", "Stork", "Technische Unie"
+        ),
+        concurrenten=(
+            "Strukton", "Heijmans", "BAM", "Imtech", "TBI", "VolkerWessels",
+            "Dura Vermeer", "Van Gelder", "Joulz"
+        ),
+        sector_keywords=(
+            "elektrotechniek", "E-techniek", "elektra", "stroom", "elektrisch",
+            "installatie", "utiliteit", "industrie", "woningbouw", "nieuwbouw"
+        )
+    )
+
+
+def _build_monteur_installatie() -> FunctieGroep:
+    return FunctieGroep(
+        id="monteur_installatie",
+        naam="Monteur Installatietechniek",
+        categorie="techniek",
+        titels=("Monteur", "Installatiemonteur", "Servicemonteur", "Technicus"),
+        synoniemen=(
+            "Installatiemonteur", "Monteur Installatietechniek",
+            "W-Monteur", "HVAC Monteur", "Klimaatmonteur",
+            "Loodgieter", "Sanitair Monteur", "CV Monteur",
+            "Senior Installatiemonteur", "Junior Installatiemonteur", "Medior Installatiemonteur",
+            "Eerste Monteur Installatietechniek", "1e Monteur W-techniek",
+            "Allround Installatiemonteur", "Verwarmingsmonteur",
+            "Airco Monteur", "Koelmonteur", "Koeltechnisch Monteur",
+            "Klimaattechnisch Monteur", "Luchtbehandelingsmonteur",
+            "Gasmonteur", "Gasfitter", "Fitter", "Pijpfitter",
+            "Monteur Werktuigbouwkunde", "WTB Monteur",
+            "Monteur Klimaatbeheersing", "Installateur HVAC",
+            "Onderhoudsmonteur Installatie", "Storingsmonteur Installatie",
+            "Mechanisch Monteur", "Monteur Warmtepompen",
+            "Monteur Zonnepanelen", "Monteur Duurzame Energie",
+            "Installatiemonteur Woningbouw", "Installatiemonteur Utiliteit",
+            "Technicus Installatietechniek", "Aankomend Installatiemonteur"
+        ),
+        english_titles=(
+            "HVAC Technician", "Installation Technician", "Plumber",
+            "Heating Engineer", "Refrigeration Technician", "Air Conditioning Technician",
+            "Mechanical Fitter", "Pipe Fitter", "HVAC Installer",
+            "Climate Control Technician", "Ventilation Technician"
+        ),
+        skills=(
+            "HVAC", "klimaattechniek", "sanitair", "loodgieterij",
+            "CV-installaties", "koeltechniek", "F-gassen",
+            "luchtbehandeling", "ventilatie", "airconditioning",
+            "warmtepompen", "vloerverwarming", "radiatoren",
+            "gasleidingen", "waterleidingen", "riolering",
+            "solderen", "persen", "buiswerk", "laswerk",
+            "tekeningen lezen", "isometrieën", "P&ID schema's",
+            "inregelen", "balanceren", "commissioning",
+            "legionellapreventie", "drinkwaterinstallaties",
+            "sprinklerinstallaties", "blusinstallaties",
+            "ploegendienst", "storingswacht"
+        ),
+        certificeringen=(
+            "VCA VOL", "VCA Basis", "F-gassen categorie I", "F-gassen categorie II",
+            "STEK certificaat", "EPBD certificaat",
+            "MBO Installatiemonteur niveau 2", "MBO Installatiemonteur niveau 3",
+            "MBO Eerste Installatiemonteur niveau 4",
+            "MBO Monteur Werktuigkundige Installaties",
+            "BOL Installatietechniek", "BBL Installatietechniek",
+            "Legionella risicoanalyse", "ISSO cursussen",
+            "Warmtepomp certificaat", "Uneto-VNI diploma"
+        ),
+        look_alikes=("monteur_elektro", "servicemonteur", "onderhoudsmonteur", "koeltechnicus"),
+        typische_werkgevers=(
+            "Kuijpers", "Breman", "Unica", "Aalberts", "Feenstra",
+            "Van der Valk Installatietechniek", "Daikin", "Carrier"
+        ),
+        concurrenten=(
+            "Strukton", "Heijmans", "Croonwolter&dros", "Imtech",
+            "Spie", "Engie", "Equans"
+        ),
+        sector_keywords=(
+            "installatietechniek", "HVAC", "klimaat", "sanitair", "CV",
+            "W-techniek", "werktuigbouw", "verwarming", "koeling", "ventilatie"
+        )
+    )
+
+
+def _build_servicemonteur() -> FunctieGroep:
+    return FunctieGroep(
+        id="servicemonteur",
+        naam="Servicemonteur",
+        categorie="techniek",
+        titels=("Servicemonteur", "Field Service Engineer", "Storingmonteur", "Onderhoudsmonteur"),
+        synoniemen=(
+            "Servicemonteur", "Service Technicus", "Field Engineer",
+            "Storingsdienst Monteur", "Onderhoudsmonteur",
+            "Service Engineer", "Buitendienstmonteur",
+            "Senior Servicemonteur", "Junior Servicemonteur", "Medior Servicemonteur",
+            "Field Service Technician", "Field Technician", "Service Technician",
+            "Storingsmonteur", "Piketmonteur", "Consignatiedienst Monteur",
+            "Buitendienst Technicus", "Reizend Monteur", "Mobiel Monteur",
+            "Service Medewerker Technisch", "Technisch Servicemedewerker",
+            "Servicemonteur Buitendienst", "Servicemonteur Industrie",
+            "Allround Servicemonteur", "1e Servicemonteur",
+            "Preventief Onderhoudsmonteur", "Correctief Onderhoudsmonteur",
+            "Onderhoudstechnicus", "Maintenance Technician",
+            "Servicemonteur Liften", "Servicemonteur Roltrappen",
+            "Servicemonteur Medische Apparatuur", "Servicemonteur Kantoorapparatuur",
+            "Servicemonteur Horeca", "Servicemonteur Koelapparatuur"
+        ),
+        english_titles=(
+            "Field Service Engineer", "Service Technician", "Maintenance Technician",
+            "Field Technician", "Service Engineer", "Technical Service Engineer",
+            "Breakdown Engineer", "On-site Technician", "Customer Engineer",
+            "Maintenance Engineer", "After Sales Engineer"
+        ),
+        skills=(
+            "storingsdienst", "onderhoud", "troubleshooting",
+            "klantcontact", "rijbewijs B", "PLC", "elektrotechniek",
+            "storingsanalyse", "root cause analysis", "preventief onderhoud",
+            "correctief onderhoud", "commissioning", "inbedrijfstelling",
+            "rapportage", "werkorders", "servicerapporten",
+            "montage", "demontage", "revisie",
+            "24-uurs service", "consignatiedienst", "piketdienst",
+            "klantvriendelijkheid", "communicatief", "zelfstandig werken",
+            "diagnose", "foutopsporing", "meetapparatuur"
+        ),
+        certificeringen=(
+            "VCA VOL", "VCA Basis", "NEN3140 VOP", "NEN3140 VP", "NEN3140",
+            "Rijbewijs B", "Rijbewijs BE", "Rijbewijs C",
+            "MBO Mechatronica", "MBO Elektrotechniek", "MBO Werktuigbouwkunde",
+            "Heftruck certificaat", "Hoogwerker certificaat",
+            "EHBO", "BHV"
+        ),
+        look_alikes=("monteur_elektro", "monteur_installatie", "onderhoudsmonteur", "mechatronicus"),
+        typische_werkgevers=(
+            "Thyssenkrupp", "Kone", "Otis", "Schindler",
+            "Vanderlande", "Marel", "GEA", "Tetra Pak"
+        ),
+        concurrenten=(
+            "Thyssenkrupp", "Kone", "Otis", "Schindler", "Engie",
+            "Stork", "Spie", "Bilfinger"
+        ),
+        sector_keywords=(
+            "service", "onderhoud", "storingsdienst", "field", "buitendienst",
+            "maintenance", "storing", "reparatie", "revisie"
+        )
+    )
+
+
+def _build_mechatronicus() -> FunctieGroep:
+    return FunctieGroep(
+        id="mechatronicus",
+        naam="Mechatronicus",
+        categorie="techniek",
+        titels=("Mechatronicus", "Technicus Mechatronica", "Mechatronic Engineer"),
+        synoniemen=(
+            # Basis titels
+            "Mechatronicus", "Technicus Mechatronica", "Mechatronica Specialist",
+            "Elektromechanicus", "Automatiseringstechnicus",
+            # Seniority variaties
+            "Senior Mechatronicus", "Junior Mechatronicus", "Medior Mechatronicus",
+            "Lead Mechatronicus", "Allround Mechatronicus",
+            # Specialisaties
+            "Mechatronicus Robotica", "Mechatronicus Vision", "Mechatronicus Motion Control",
+            "Mechatronicus Hightech", "Mechatronicus Semiconductor",
+            "Mechatronicus Vakmanschap", "Onderhouds Mechatronicus",
+            # Hybride titels
+            "Mechatronisch Monteur", "Mechatronisch Technicus", "Mechatronisch Engineer",
+            "Mechatronisch Specialist", "Automatisering Specialist",
+            # Functievariaties
+            "System Engineer Mechatronica", "Ontwikkelaar Mechatronica",
+            "Mechatronica Ingenieur", "R&D Mechatronicus",
+            "Mechatronicus Ontwikkeling", "Mechatronicus Onderhoud"
+        ),
+        english_titles=(
+            "Mechatronics Engineer", "Automation Technician", "Electromechanical Technician",
+            "Mechatronic Technician", "Automation Engineer", "Motion Control Engineer",
+            "Robotics Engineer", "System Integration Engineer", "Controls Engineer",
+            "Senior Mechatronics Engineer", "Junior Mechatronics Engineer"
+        ),
+        skills=(
+            # PLC Systemen
+            "PLC", "Siemens S7", "Siemens TIA Portal", "Allen Bradley", "Rockwell",
+            "Omron", "Beckhoff TwinCAT", "Codesys", "B&R Automation",
+            # Motion Control
+            "Servo", "Servoaandrijving", "Motion Control", "Frequentieregeling",
+            "Bosch Rexroth", "SEW", "Lenze", "Festo",
+            # Robotica
+            "Robotica", "KUKA", "ABB Robot", "Fanuc Robot", "Universal Robots",
+            "Cobot", "Yaskawa", "Mitsubishi Robot",
+            # Mechanisch & Elektrisch
+            "Pneumatiek", "Hydrauliek", "Elektrotechniek", "Werktuigbouw",
+            "Sensoriek", "Vision Systemen", "Cognex", "Keyence",
+            # Software
+            "Python", "C++", "C#", "LabVIEW", "MATLAB",
+            # Overig
+            "EPLAN", "SolidWorks", "CAD", "Troubleshooting", "Inbedrijfstelling"
+        ),
+        certificeringen=(
+            # Veiligheid
+            "VCA VOL", "VCA Basis", "NEN3140 VOP", "NEN3140 VP",
+            # Opleidingen
+            "MBO Mechatronica niveau 4", "MBO Mechatronica niveau 3",
+            "HBO Mechatronica", "Associate Degree Mechatronica",
+            "Bachelor Mechatronica", "Technicus Mechatronica",
+            # Siemens certificaten
+            "Siemens S7 certificaat", "Siemens TIA Portal certificaat",
+            "Siemens SITRAIN", "Siemens Certified Professional",
+            # Robot certificaten
+            "KUKA certificaat", "ABB Robot certificaat", "Fanuc certificaat",
+            # Overig
+            "Festo Pneumatiek", "Bosch Rexroth certificaat"
+        ),
+        look_alikes=("automatiseringsengineer", "plc_programmeur", "monteur_elektro"),
+        typische_werkgevers=(
+            "ASML", "Philips", "VDL", "Thermo Fisher", "NXP"
+        ),
+        concurrenten=(
+            "ASML", "Philips", "VDL", "Thermo Fisher", "Demcon", "TMC"
+        ),
+        sector_keywords=(
+            "mechatronica", "automatisering", "robotica", "hightech",
+            "semiconductor", "motion control", "machine", "systeem"
+        )
+    )
+
+
+BUILDERS: Dict[str, Callable[[], FunctieGroep]] = {
+    "monteur_elektro": _build_monteur_elektro,
+    "monteur_installatie": _build_monteur_installatie,
+    "servicemonteur": _build_servicemonteur,
+    "mechatronicus": _build_mechatronicus,
+}
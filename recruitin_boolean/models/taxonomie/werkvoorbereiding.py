@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Functiegroepen: Werkvoorbereiding & calculatie
+"""
+
+from typing import Callable, Dict
+
+from ..functiegroep import FunctieGroep
+
+
+def _build_werkvoorbereider_elektro() -> FunctieGroep:
+    return FunctieGroep(
+        id="werkvoorbereider_elektro",
+        naam="Werkvoorbereider Elektrotechniek",
+        categorie="werkvoorbereiding",
+        titels=(
+            "Werkvoorbereider",
+            "Calculator",
+            "Technisch Planner",
+            "Tekenaar-Werkvoorbereider",
+        ),
+        synoniemen=(
+            "Werkvoorbereider Elektrotechniek",
+            "Calculator E-techniek",
+            "Technisch Werkvoorbereider",
+            "Project Planner Elektro",
+            "Werkvoorbereider Electrical",
+            "E-Werkvoorbereider",
+            "Werkvoorbereider E&I",
+            "WVB Elektro",
+            "Werkvoorbereider Sterkstroom",
+            "Werkvoorbereider Zwakstroom",
+            "Werkvoorbereider Industriële Automatisering",
+            "Tekenaar Werkvoorbereider Elektro",
+            "Senior Werkvoorbereider E-techniek",
+            "Junior Werkvoorbereider Elektro",
+            "Medior Werkvoorbereider Elektrotechniek",
+            "Werkvoorbereider Laagspanning",
+            "Werkvoorbereider Middenspanning",
+            "Werkvoorbereider Utiliteit",
+            "Technisch Calculator Elektro",
+            "Elektrotechnisch Werkvoorbereider",
+            "Coördinator Werkvoorbereiding Elektro",
+        ),
+        english_titles=(
+            "Work Planner",
+            "Technical Planner",
+            "Project Calculator",
+            "Electrical Planner",
+            "Construction Planner",
+            "Electrical Work Preparer",
+            "E&I Work Preparer",
+            "MEP Work Planner",
+            "Electrical Estimator",
+            "Technical Coordinator Electrical",
+            "Design Coordinator Electrical",
+        ),
+        skills=(
+            "AutoCAD",
+            "Revit",
+            "E-Plan",
+            "EPLAN",
+            "EPLAN Electric P8",
+            "EPLAN Pro Panel",
+            "BIM",
+            "NEN1010",
+            "NEN3140",
+            "calculatie",
+            "werkvoorbereiding",
+            "3D tekenen",
+            "elektrotechniek",
+            "MS Project",
+            "Primavera",
+            "SAP",
+            "Navisworks",
+            "Dialux",
+            "Relux",
+            "Caneco",
+            "Desigo CC",
+            "See Electrical",
+            "NEN-EN-IEC 61439",
+            "materiaalbegrotingen",
+            "installatietekeningen",
+            "PLC schema's",
+            "laagspanningsinstallaties",
+            "middenspanningsinstallaties",
+            "E&I engineering",
+            "schema lezen",
+            "tekening lezen",
+            "uittrekstaten",
+        ),
+        certificeringen=(
+            "VCA",
+            "VCA VOL",
+            "VCA Basis",
+            "NEN1010",
+            "NEN3140",
+            "BIM certificaat",
+            "MBO Elektrotechniek niveau 4",
+            "HBO Elektrotechniek",
+            "MBO Middenkaderfunctionaris Elektrotechnische Installaties",
+            "EPLAN gecertificeerd",
+            "Revit MEP certificaat",
+            "AutoCAD certificaat",
+        ),
+        look_alikes=(
+            "werkvoorbereider_installatie",
+            "calculator_bouw",
+            "projectleider_elektro",
+        ),
+        typische_werkgevers=(
+            "Unica",
+            "Croonwolter&dros",
+            "Hoppenbrouwers",
+            "Kuijpers",
+            "Breman",
+            "Spie",
+            "Engie",
+            "Imtech",
+            "Equans",
+        ),
+        concurrenten=(
+            "Strukton",
+            "Heijmans",
+            "BAM",
+            "VolkerWessels",
+            "Dura Vermeer",
+            "TBI",
+            "GMB",
+            "Van Gelder",
+        ),
+        sector_keywords=(
+            "elektrotechniek",
+            "E-techniek",
+            "electrical",
+            "elektro",
+            "laagspanning",
+            "hoogspanning",
+            "middenspanning",
+            "sterkstroom",
+            "zwakstroom",
+            "utiliteit",
+            "E&I",
+        ),
+    )
+
+
+def _build_werkvoorbereider_installatie() -> FunctieGroep:
+    return FunctieGroep(
+        id="werkvoorbereider_installatie",
+        naam="Werkvoorbereider Installatietechniek",
+        categorie="werkvoorbereiding",
+        titels=(
+            "Werkvoorbereider",
+            "Calculator",
+            "Technisch Planner",
+            "Tekenaar-Werkvoorbereider",
+        ),
+        synoniemen=(
+            "Werkvoorbereider Installatietechniek",
+            "Calculator Installatie",
+            "Werkvoorbereider W-techniek",
+            "Calculator HVAC",
+            "Werkvoorbereider Klimaat",
+            "W-Werkvoorbereider",
+            "Werkvoorbereider Klimaattechniek",
+            "Werkvoorbereider Sanitair",
+            "Werkvoorbereider Koeltechniek",
+            "WVB Installatie",
+            "WVB W-techniek",
+            "Tekenaar Werkvoorbereider Installatie",
+            "Senior Werkvoorbereider W-techniek",
+            "Junior Werkvoorbereider Installatietechniek",
+            "Medior Werkvoorbereider HVAC",
+            "Werkvoorbereider Utiliteit",
+            "Werkvoorbereider Sprinkler",
+            "Werkvoorbereider Luchtbehandeling",
+            "Technisch Calculator Installatie",
+            "Coördinator Werkvoorbereiding Installatie",
+            "Werkvoorbereider CV",
+            "Werkvoorbereider Verwarming",
+            "Werkvoorbereider Gebouwgebonden Installaties",
+        ),
+        english_titles=(
+            "HVAC Planner",
+            "Installation Planner",
+            "MEP Calculator",
+            "MEP Work Preparer",
+            "Mechanical Work Planner",
+            "HVAC Estimator",
+            "Plumbing Work Preparer",
+            "MEP Coordinator",
+            "Technical Planner HVAC",
+        ),
+        skills=(
+            "BIM",
+            "Revit",
+            "Revit MEP",
+            "AutoCAD",
+            "AutoCAD MEP",
+            "calculatie",
+            "HVAC",
+            "klimaattechniek",
+            "sanitair",
+            "werktuigbouw",
+            "MS Project",
+            "Primavera",
+            "SAP",
+            "Navisworks",
+            "Stabicad",
+            "DDS-CAD",
+            "Trimble",
+            "Plancal Nova",
+            "VABI",
+            "Vabi Elements",
+            "warmtepompen",
+            "koelmachines",
+            "luchtbehandeling",
+            "materiaalbegrotingen",
+            "installatietekeningen",
+            "isometrieën",
+            "leidingschema's",
+            "P&ID",
+            "CV-installaties",
+            "sprinklerinstallaties",
+            "tekening lezen",
+            "uittrekstaten",
+            "gebouwgebonden installaties",
+        ),
+        certificeringen=(
+            "VCA",
+            "VCA VOL",
+            "VCA Basis",
+            "F-gassen",
+            "BIM certificaat",
+            "MBO Installatie- en Koudetechniek niveau 4",
+            "HBO Werktuigbouwkunde",
+            "MBO Middenkaderfunctionaris Installaties",
+            "Revit MEP certificaat",
+            "ISSO gecertificeerd",
+            "STEK certificaat",
+            "AutoCAD certificaat",
+        ),
+        look_alikes=(
+            "werkvoorbereider_elektro",
+            "calculator_bouw",
+            "projectleider_installatie",
+        ),
+        typische_werkgevers=(
+            "Unica",
+            "Kuijpers",
+            "Breman",
+            "Aalberts",
+            "Engie",
+            "Equans",
+        ),
+        concurrenten=("Strukton", "Heijmans", "BAM", "Croonwolter&dros"),
+        sector_keywords=(
+            "installatietechniek",
+            "W-techniek",
+            "HVAC",
+            "klimaat",
+            "sanitair",
+            "koude",
+            "warmte",
+            "verwarming",
+            "ventilatie",
+            "luchtbehandeling",
+            "utiliteit",
+        ),
+    )
+
+
+def _build_calculator_bouw() -> FunctieGroep:
+    return FunctieGroep(
+        id="calculator_bouw",
+        naam="Calculator Bouw",
+        categorie="werkvoorbereiding",
+        titels=("Calculator", "Kostencalculator", "Bouwcalculator", "Tender Manager"),
+        synoniemen=(
+            "Calculator Bouw",
+            "Bouwkostencalculator",
+            "Tender Calculator",
+            "Aanbestedingscalculator",
+            "Prijscalculator",
+            "Calculator Utiliteitsbouw",
+            "Calculator Woningbouw",
+            "Calculator GWW",
+            "Calculator Infra",
+            "Senior Calculator",
+            "Junior Calculator",
+            "Medior Calculator",
+            "Tendermanager",
+            "Inschrijvingsmanager",
+            "Calculatiespecialist",
+            "Kostenspecialist Bouw",
+            "Calculator Nieuwbouw",
+            "Calculator Renovatie",
+        ),
+        english_titles=(
+            "Quantity Surveyor",
+            "Cost Estimator",
+            "Tender Specialist",
+            "Bid Manager",
+            "Estimation Manager",
+            "Construction Estimator",
+            "Tender Manager",
+            "Cost Engineer",
+        ),
+        skills=(
+            "calculatie",
+            "IBIS",
+            "Excel",
+            "kostprijsberekening",
+            "bouwkunde",
+            "aanbestedingen",
+            "contracten",
+            "Orca",
+            "Kraan",
+            "12Build",
+            "BIM",
+            "Revit",
+            "RAW-bestekken",
+            "UAV",
+            "STABU",
+            "bouwbesluit",
+            "bestekken schrijven",
+            "MS Project",
+            "Primavera",
+            "kostenbewaking",
+            "nacalculatie",
+            "offertes",
+            "begroten",
+            "inschrijvingen",
+        ),
+        certificeringen=(
+            "VCA",
+            "VCA VOL",
+            "HBO Bouwkunde",
+            "MBO Bouwkunde niveau 4",
+            "RICS",
+            "NVBK certificering",
+        ),
+        look_alikes=(
+            "werkvoorbereider_elektro",
+            "werkvoorbereider_installatie",
+            "projectleider_bouw",
+        ),
+        typische_werkgevers=(
+            "BAM",
+            "Heijmans",
+            "VolkerWessels",
+            "Dura Vermeer",
+            "Strukton",
+        ),
+        concurrenten=(
+            "BAM",
+            "Heijmans",
+            "VolkerWessels",
+            "Dura Vermeer",
+            "Strukton",
+            "TBI",
+            "Ballast Nedam",
+            "Van Wijnen",
+        ),
+        sector_keywords=(
+            "bouw",
+            "construction",
+            "utiliteitsbouw",
+            "woningbouw",
+            "infra",
+            "GWW",
+            "nieuwbouw",
+            "renovatie",
+            "civiel",
+        ),
+    )
+
+
+BUILDERS: Dict[str, Callable[[], FunctieGroep]] = {
+    "werkvoorbereider_elektro": _build_werkvoorbereider_elektro,
+    "werkvoorbereider_installatie": _build_werkvoorbereider_installatie,
+    "calculator_bouw": _build_calculator_bouw,
+}
@@ -4,8 +4,36 @@ Recruitin Boolean Search - Pipeline Package
 This package contains orchestration and workflow management components.
 """
 
-from .processor import JobDiggerBooleanProcessor
-from .exporters import ExcelExporter, DataExporter
-from .cli import main as cli_main
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .processor import JobDiggerBooleanProcessor
+    from .exporters import ExcelExporter, DataExporter
+    from .cli import main as cli_main
+
+# Publieke naam -> (module, attribuut). processor en exporters importeren
+# pandas; pas bij het eerste gebruik laden houdt o.a. ``--help`` snel.
+_LAZY_IMPORTS = {
+    "JobDiggerBooleanProcessor": (".processor", "JobDiggerBooleanProcessor"),
+    "ExcelExporter": (".exporters", "ExcelExporter"),
+    "DataExporter": (".exporters", "DataExporter"),
+    "cli_main": (".cli", "main"),
+}
 
 __all__ = ["JobDiggerBooleanProcessor", "ExcelExporter", "DataExporter", "cli_main"]
+
+
+def __getattr__(name: str):
+    """Import public names from their module on first access (PEP 562)."""
+    try:
+        module_name, attribute = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
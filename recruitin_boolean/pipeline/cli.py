@@ -10,26 +10,31 @@ Provides CLI access to all functionality including:
 
 import argparse
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from .processor import JobDiggerBooleanProcessor
+if TYPE_CHECKING:
+    from .processor import JobDiggerBooleanProcessor
 
 
-def show_taxonomy(processor: JobDiggerBooleanProcessor) -> None:
+def show_taxonomy(processor: "JobDiggerBooleanProcessor") -> None:
     """Display the complete functiegroep taxonomy"""
-    print("\n📚 FUNCTIEGROEP TAXONOMIE\n")
+    # Eén print voor de hele taxonomie in plaats van een print per regel
+    parts = ["\n📚 FUNCTIEGROEP TAXONOMIE\n\n"]
     for fg_id, fg in processor.functiegroepen.items():
-        print(f"{'='*60}")
-        print(f"ID: {fg_id}")
-        print(f"Naam: {fg.naam}")
-        print(f"Categorie: {fg.categorie}")
-        print(f"Titels: {', '.join(fg.titels)}")
-        print(f"Skills: {', '.join(fg.skills[:5])}")
-        print(f"Look-alikes: {', '.join(fg.look_alikes)}")
+        parts.append(
+            f"{'='*60}\n"
+            f"ID: {fg_id}\n"
+            f"Naam: {fg.naam}\n"
+            f"Categorie: {fg.categorie}\n"
+            f"Titels: {', '.join(fg.titels)}\n"
+            f"Skills: {', '.join(fg.skills[:5])}\n"
+            f"Look-alikes: {', '.join(fg.look_alikes)}\n"
+        )
+    print("".join(parts), end="")
 
 
 def show_search_for_functiegroep(
-    processor: JobDiggerBooleanProcessor, fg_id: str
+    processor: "JobDiggerBooleanProcessor", fg_id: str
 ) -> None:
     """Show boolean searches for a specific functiegroep"""
     if fg_id in processor.functiegroepen:
@@ -45,7 +50,7 @@ def show_search_for_functiegroep(
 
 
 def run_pipeline(
-    processor: JobDiggerBooleanProcessor,
+    processor: "JobDiggerBooleanProcessor",
     input_file: Optional[Path],
     output_dir: Path,
     generate_hf_data: bool,
@@ -55,13 +60,15 @@ def run_pipeline(
         input_file=input_file, output_dir=output_dir, generate_hf_data=generate_hf_data
     )
 
-    print("\n📂 Gegenereerde bestanden:")
+    lines = ["\n📂 Gegenereerde bestanden:"]
     for name, path in files.items():
         if isinstance(path, dict):
-            for sub_name, sub_path in path.items():
-                print(f"   - {sub_name}: {sub_path}")
+            lines.extend(
+                f"   - {sub_name}: {sub_path}" for sub_name, sub_path in path.items()
+            )
         else:
-            print(f"   - {name}: {path}")
+            lines.append(f"   - {name}: {path}")
+    print("\n".join(lines))
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -123,6 +130,9 @@ def main() -> None:
     parser = create_parser()
     args = parser.parse_args()
 
+    # Pas na het parsen importeren: --help en --version laden geen pandas
+    from .processor import JobDiggerBooleanProcessor
+
     # Initialize processor
     processor = JobDiggerBooleanProcessor()
 
@@ -6,12 +6,28 @@ Handles Excel export, data formatting, and file management
 
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 import pandas as pd
 import json
 
 from ..models.functiegroep import FunctieGroep
 
+try:
+    import orjson
+except ImportError:  # optional dependency, fall back to the stdlib encoder
+    orjson = None
+
+# orjson-opties voor dezelfde output als json.dump(indent=2, default=str):
+# datetimes en dataclasses gaan via default=str in plaats van native encoding
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
 
 class ExcelExporter:
     """Handles Excel export functionality"""
@@ -20,13 +36,15 @@ class ExcelExporter:
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     def export_taxonomy_to_excel(
-        self, taxonomy_data: List[Dict[str, Any]], output_path: Path
+        self,
+        taxonomy_data: Union[List[Dict[str, Any]], pd.DataFrame],
+        output_path: Path,
     ) -> Path:
         """
         Export taxonomy data to Excel format.
 
         Args:
-            taxonomy_data: List of taxonomy dictionaries
+            taxonomy_data: List of taxonomy dictionaries, or a DataFrame
             output_path: Path where to save the Excel file
 
         Returns:
@@ -37,7 +55,7 @@ class ExcelExporter:
         # Create Excel writer with multiple sheets
         with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
             # Main data sheet
-            df.to_excel(writer, sheet_name="Boolean_Searches", index=False)
+            self._write_rows(writer, df, "Boolean_Searches")
 
             # Summary sheet
             summary = self._create_taxonomy_summary(df)
@@ -49,13 +67,15 @@ class ExcelExporter:
         return output_path
 
     def export_vacancies_to_excel(
-        self, vacancies_data: List[Dict[str, Any]], output_path: Path
+        self,
+        vacancies_data: Union[List[Dict[str, Any]], pd.DataFrame],
+        output_path: Path,
     ) -> Path:
         """
         Export vacancy search results to Excel.
 
         Args:
-            vacancies_data: List of vacancy search dictionaries
+            vacancies_data: List of vacancy search dictionaries, or a DataFrame
             output_path: Path where to save the Excel file
 
         Returns:
@@ -100,11 +120,26 @@ class ExcelExporter:
             Path to the created Excel file
         """
         with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
-            matrix_df.to_excel(writer, sheet_name="Similarity_Matrix")
+            workbook = writer.book
+            worksheet = workbook.add_worksheet("Similarity_Matrix")
+
+            # Labels in de stijl van pandas' to_excel header/index; de scores
+            # per rij met één write_row
+            label_format = workbook.add_format(
+                {"bold": True, "border": 1, "align": "center", "valign": "top"}
+            )
+            if matrix_df.index.name is not None:
+                worksheet.write(0, 0, matrix_df.index.name, label_format)
+            worksheet.write_row(
+                0, 1, [str(column) for column in matrix_df.columns], label_format
+            )
+            for row_num, (label, *scores) in enumerate(
+                matrix_df.itertuples(name=None), 1
+            ):
+                worksheet.write(row_num, 0, label, label_format)
+                worksheet.write_row(row_num, 1, scores)
 
             # Add heatmap formatting
-            workbook = writer.book
-            worksheet = writer.sheets["Similarity_Matrix"]
 
             # Create color format for similarity scores
             color_format = workbook.add_format(
@@ -129,6 +164,28 @@ class ExcelExporter:
 
         return output_path
 
+    def _write_rows(self, writer, df: pd.DataFrame, sheet_name: str):
+        """
+        Write a DataFrame (header and rows, no index) to a new sheet.
+
+        Same cells as ``df.to_excel(writer, sheet_name, index=False)`` for
+        text and numbers, but one ``write_row`` per row instead of the
+        per-cell styling of pandas' ExcelFormatter. Header formatting is left
+        to the ``_format_*_sheets`` methods.
+
+        Args:
+            writer: xlsxwriter ExcelWriter
+            df: Data to write
+            sheet_name: Name of the new sheet
+        """
+        worksheet = writer.book.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, [str(column) for column in df.columns])
+
+        # Ontbrekende waarden als None: xlsxwriter laat die cellen leeg
+        values = df.astype(object).where(df.notna(), None)
+        for row_num, row in enumerate(values.itertuples(index=False, name=None), 1):
+            worksheet.write_row(row_num, 0, row)
+
     def _create_taxonomy_summary(self, df: pd.DataFrame) -> pd.DataFrame:
         """Create summary statistics for taxonomy export"""
         summary_data = []
@@ -240,7 +297,22 @@ class DataExporter:
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     def export_to_json(self, data: Any, output_path: Path) -> Path:
-        """Export data to JSON format"""
+        """
+        Export data to JSON format.
+
+        Uses orjson when installed; the file is the same as with the stdlib
+        encoder, except that NaN/Infinity are written as null.
+        """
+        if orjson is not None:
+            try:
+                encoded = orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+            except orjson.JSONEncodeError:
+                pass  # bv. integers groter dan 64 bit: stdlib encoder
+            else:
+                with open(output_path, "wb") as f:
+                    f.write(encoded)
+                return output_path
+
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False, default=str)
         return output_path
@@ -257,9 +329,15 @@ class DataExporter:
         output_dir.mkdir(parents=True, exist_ok=True)
         files = {}
 
-        # Create detailed data structure
+        # Gedetailleerde (JSON) en platte (CSV) data in één pass
         detailed_data = {}
+        flat_data = []
         for fg_id, fg in functiegroepen.items():
+            total_titels = len(fg.titels)
+            total_skills = len(fg.skills)
+            total_look_alikes = len(fg.look_alikes)
+            total_concurrenten = len(fg.concurrenten)
+
             detailed_data[fg_id] = {
                 "id": fg_id,
                 "naam": fg.naam,
@@ -268,39 +346,33 @@ class DataExporter:
                 "skills": fg.skills,
                 "look_alikes": fg.look_alikes,
                 "concurrenten": fg.concurrenten,
-                "locaties": fg.locaties,
                 "meta": {
-                    "total_titels": len(fg.titels),
-                    "total_skills": len(fg.skills),
-                    "total_look_alikes": len(fg.look_alikes),
-                    "total_concurrenten": len(fg.concurrenten),
-                    "total_locaties": len(fg.locaties),
+                    "total_titels": total_titels,
+                    "total_skills": total_skills,
+                    "total_look_alikes": total_look_alikes,
+                    "total_concurrenten": total_concurrenten,
                 },
             }
-
-        # Export as JSON
-        json_path = output_dir / f"functiegroepen_detailed_{self.timestamp}.json"
-        files["json"] = self.export_to_json(detailed_data, json_path)
-
-        # Export as flat CSV
-        flat_data = []
-        for fg_id, fg in functiegroepen.items():
             flat_data.append(
                 {
                     "Functiegroep_ID": fg_id,
                     "Naam": fg.naam,
                     "Categorie": fg.categorie,
-                    "Titels_Count": len(fg.titels),
-                    "Skills_Count": len(fg.skills),
-                    "Look_Alikes_Count": len(fg.look_alikes),
-                    "Concurrenten_Count": len(fg.concurrenten),
-                    "Locaties_Count": len(fg.locaties),
+                    "Titels_Count": total_titels,
+                    "Skills_Count": total_skills,
+                    "Look_Alikes_Count": total_look_alikes,
+                    "Concurrenten_Count": total_concurrenten,
                     "Sample_Titels": " | ".join(fg.titels[:3]),
                     "Sample_Skills": " | ".join(fg.skills[:3]),
                     "Sample_Look_Alikes": " | ".join(fg.look_alikes[:3]),
                 }
             )
 
+        # Export as JSON
+        json_path = output_dir / f"functiegroepen_detailed_{self.timestamp}.json"
+        files["json"] = self.export_to_json(detailed_data, json_path)
+
+        # Export as flat CSV
         csv_path = output_dir / f"functiegroepen_overview_{self.timestamp}.csv"
         files["csv"] = self.export_to_csv(pd.DataFrame(flat_data), csv_path)
 
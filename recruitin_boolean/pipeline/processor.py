@@ -9,16 +9,48 @@ Hoofdprocessor die alles combineert:
 """
 
 from datetime import datetime
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 import json
-import pandas as pd
+import numpy as np
 
 from ..models.taxonomie import FUNCTIEGROEPEN
 from ..search.boolean_builder import BooleanSearchGenerator
 from ..ai.lookalike_matcher import LookAlikeMatcher
 from ..ai.huggingface_exporter import HuggingFaceDataGenerator
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Kolommen van de taxonomie-export en de vacature-searches, in de volgorde
+# van de rij-tuples
+_TAXONOMY_COLUMNS = [
+    "Functiegroep_ID",
+    "Functiegroep_Naam",
+    "Categorie",
+    "Search_Type",
+    "Boolean_String",
+    "Titels",
+    "Skills",
+    "Look_Alikes",
+    "Concurrenten",
+]
+
+_VACANCY_SEARCH_COLUMNS = [
+    "Vacature_ID",
+    "Functietitel",
+    "Bedrijf",
+    "Standplaats",
+    "Functiegroep",
+    "Search_Type",
+    "Priority",
+    "Boolean_String",
+    "Boolean_Met_Locatie",
+    "Verwachte_Resultaten",
+]
+
 
 class JobDiggerBooleanProcessor:
     """
@@ -32,10 +64,12 @@ class JobDiggerBooleanProcessor:
     def __init__(self):
         self.functiegroepen = FUNCTIEGROEPEN
         self.search_generator = BooleanSearchGenerator(self.functiegroepen)
-        self.lookalike_matcher = LookAlikeMatcher(self.functiegroepen)
+        self.lookalike_matcher = LookAlikeMatcher(
+            self.functiegroepen, self.search_generator
+        )
         self.hf_generator = HuggingFaceDataGenerator(self.functiegroepen)
 
-    def process_vacancies_file(self, input_file: Path) -> pd.DataFrame:
+    def process_vacancies_file(self, input_file: Path) -> "pd.DataFrame":
         """
         Verwerkt een vacature Excel bestand en genereert boolean searches.
 
@@ -45,93 +79,109 @@ class JobDiggerBooleanProcessor:
         Returns:
             DataFrame met gegenereerde searches
         """
+        import pandas as pd
+
         # Lees input
-        df = pd.read_excel(input_file, header=1)
+        df = pd.read_excel(input_file, header=1, engine=_excel_read_engine())
+
+        # Kolommen één keer als lists ophalen; iterrows maakt per rij een
+        # Series en kost meer dan het genereren van de searches zelf
+        titles = _column_values(df, "Vacature", "Functietitel")
+        rows = zip(
+            df.index,
+            titles,
+            _column_values(df, "Bedrijf", "Bedrijfsnaam"),
+            _column_values(df, "Locatie", "Standplaats"),
+            # Herhaalde titels worden één keer gematcht
+            self.search_generator.match_vacancies(titles),
+        )
 
         results = []
-        for idx, row in df.iterrows():
-            vacancy_title = row.get("Vacature", row.get("Functietitel", ""))
-            company = row.get("Bedrijf", row.get("Bedrijfsnaam", ""))
-            location = row.get("Locatie", row.get("Standplaats", ""))
-
-            if not vacancy_title:
+        for idx, vacancy_title, company, location, fg in rows:
+            if fg is None:
                 continue
 
             # Genereer searches
             searches = self.search_generator.generate_all_searches_for_vacancy(
-                vacancy_title=vacancy_title, company=company, location=location
+                vacancy_title=vacancy_title,
+                company=company,
+                location=location,
+                fg_id=fg.id,
             )
 
             if "error" not in searches:
+                functiegroep = searches["functiegroep"]["naam"]
                 for search_type, search_data in searches.get("searches", {}).items():
                     results.append(
-                        {
-                            "Vacature_ID": idx + 1,
-                            "Functietitel": vacancy_title,
-                            "Bedrijf": company,
-                            "Standplaats": location,
-                            "Functiegroep": searches["functiegroep"]["naam"],
-                            "Search_Type": search_type.upper(),
-                            "Priority": search_data["priority"],
-                            "Boolean_String": search_data["boolean"],
-                            "Boolean_Met_Locatie": search_data["boolean_with_location"],
-                            "Verwachte_Resultaten": search_data["expected_results"],
-                        }
+                        (
+                            idx + 1,
+                            vacancy_title,
+                            company,
+                            location,
+                            functiegroep,
+                            search_type.upper(),
+                            search_data["priority"],
+                            search_data["boolean"],
+                            search_data["boolean_with_location"],
+                            search_data["expected_results"],
+                        )
                     )
 
-        return pd.DataFrame(results)
+        return pd.DataFrame(results, columns=_VACANCY_SEARCH_COLUMNS)
 
-    def generate_full_taxonomy_export(self) -> pd.DataFrame:
+    def generate_full_taxonomy_export(self) -> "pd.DataFrame":
         """
         Exporteert de volledige functiegroep taxonomie met searches.
 
         Returns:
             DataFrame met alle functiegroepen en hun searches
         """
+        import pandas as pd
+
         results = []
 
         for fg_id, fg in self.functiegroepen.items():
             searches = self.search_generator.generate_combined_search(fg)
 
+            # Gelijk voor alle search types van de functiegroep
+            titels = " | ".join(fg.titels)
+            skills = " | ".join(fg.skills[:5])
+            look_alikes = " | ".join(fg.look_alikes)
+            concurrenten = " | ".join(fg.concurrenten[:5])
+
             for search_type, boolean_string in searches.items():
                 results.append(
-                    {
-                        "Functiegroep_ID": fg_id,
-                        "Functiegroep_Naam": fg.naam,
-                        "Categorie": fg.categorie,
-                        "Search_Type": search_type.upper(),
-                        "Boolean_String": boolean_string,
-                        "Titels": " | ".join(fg.titels),
-                        "Skills": " | ".join(fg.skills[:5]),
-                        "Look_Alikes": " | ".join(fg.look_alikes),
-                        "Concurrenten": " | ".join(fg.concurrenten[:5]),
-                    }
+                    (
+                        fg_id,
+                        fg.naam,
+                        fg.categorie,
+                        search_type.upper(),
+                        boolean_string,
+                        titels,
+                        skills,
+                        look_alikes,
+                        concurrenten,
+                    )
                 )
 
-        return pd.DataFrame(results)
+        return pd.DataFrame(results, columns=_TAXONOMY_COLUMNS)
 
-    def generate_lookalike_matrix(self) -> pd.DataFrame:
+    def generate_lookalike_matrix(self) -> "pd.DataFrame":
         """
         Genereert een look-alike similarity matrix.
 
         Returns:
             DataFrame met similarity scores tussen functiegroepen
         """
-        data = []
+        import pandas as pd
 
-        for fg1_id, fg1 in self.functiegroepen.items():
-            row = {"Functiegroep": fg1.naam}
+        names = [fg.naam for fg in self.functiegroepen.values()]
+        scores = self.lookalike_matcher.similarity_matrix()
+        np.fill_diagonal(scores, 1.0)
 
-            for fg2_id, fg2 in self.functiegroepen.items():
-                if fg1_id == fg2_id:
-                    row[fg2.naam] = 1.0
-                else:
-                    similarity = self.lookalike_matcher.calculate_similarity(fg1, fg2)
-                    row[fg2.naam] = similarity
-
-            data.append(row)
-
-        return pd.DataFrame(data).set_index("Functiegroep")
+        return pd.DataFrame(
+            scores, index=pd.Index(names, name="Functiegroep"), columns=names
+        )
 
     def run_full_pipeline(
         self,
@@ -156,11 +206,22 @@ class JobDiggerBooleanProcessor:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         files = {}
 
+        # Met xlsxwriter gaan de sheets via de ExcelExporter (opmaak en
+        # direct geschreven rijen); anders de kale pandas-export
+        excel_exporter = None
+        if find_spec("xlsxwriter") is not None:
+            from .exporters import ExcelExporter
+
+            excel_exporter = ExcelExporter()
+
         # 1. Taxonomie export
         print("📊 Genereren functiegroep taxonomie...")
         taxonomy_df = self.generate_full_taxonomy_export()
         taxonomy_path = output_dir / f"boolean_taxonomy_{timestamp}.xlsx"
-        taxonomy_df.to_excel(taxonomy_path, index=False)
+        if excel_exporter is not None:
+            excel_exporter.export_taxonomy_to_excel(taxonomy_df, taxonomy_path)
+        else:
+            taxonomy_df.to_excel(taxonomy_path, index=False)
         files["taxonomy"] = taxonomy_path
         print(f"   ✅ {len(taxonomy_df)} searches gegenereerd")
 
@@ -168,7 +229,10 @@ class JobDiggerBooleanProcessor:
         print("🔗 Genereren look-alike matrix...")
         matrix_df = self.generate_lookalike_matrix()
         matrix_path = output_dir / f"lookalike_matrix_{timestamp}.xlsx"
-        matrix_df.to_excel(matrix_path)
+        if excel_exporter is not None:
+            excel_exporter.export_matrix_to_excel(matrix_df, matrix_path)
+        else:
+            matrix_df.to_excel(matrix_path)
         files["lookalike_matrix"] = matrix_path
         print(f"   ✅ {len(matrix_df)} x {len(matrix_df)} matrix")
 
@@ -177,7 +241,10 @@ class JobDiggerBooleanProcessor:
             print(f"📁 Verwerken vacatures uit {input_file.name}...")
             vacancies_df = self.process_vacancies_file(input_file)
             vacancies_path = output_dir / f"boolean_searches_{timestamp}.xlsx"
-            vacancies_df.to_excel(vacancies_path, index=False)
+            if excel_exporter is not None:
+                excel_exporter.export_vacancies_to_excel(vacancies_df, vacancies_path)
+            else:
+                vacancies_df.to_excel(vacancies_path, index=False)
             files["vacancies"] = vacancies_path
             print(f"   ✅ {len(vacancies_df)} searches voor vacatures")
 
@@ -202,3 +269,41 @@ class JobDiggerBooleanProcessor:
 
         print("\n✨ Pipeline voltooid!")
         return files
+
+
+def _column_values(df: "pd.DataFrame", *names: str) -> List:
+    """
+    Values of the first of ``names`` that is a column of ``df``.
+
+    Args:
+        df: Input DataFrame
+        names: Candidate column names, in order of preference
+
+    Returns:
+        List with one value per row; empty strings when no column exists
+    """
+    for name in names:
+        if name in df.columns:
+            return df[name].tolist()
+    return [""] * len(df)
+
+
+@lru_cache(maxsize=None)
+def _excel_read_engine() -> Optional[str]:
+    """
+    Engine for reading vacancy Excel files.
+
+    calamine (Rust) parses sheets much faster than openpyxl; it is used when
+    the optional python-calamine package is installed and pandas supports it
+    (pandas 2.2+). Otherwise pandas picks its default engine.
+
+    Returns:
+        "calamine", or None for the pandas default
+    """
+    if find_spec("python_calamine") is None:
+        return None
+
+    import pandas as pd
+
+    major, minor = (int(part) for part in pd.__version__.split(".")[:2])
+    return "calamine" if (major, minor) >= (2, 2) else None
@@ -7,8 +7,71 @@ This module handles the construction of complex search queries based on job func
 skills, certifications, and other criteria.
 """
 
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 from ..models import FunctieGroep
+from ..models.functiegroep import normalize_term
+from .term_automaton import TermAutomaton
+
+# Score per gevonden sector keyword bij het matchen van vacaturetitels
+_SECTOR_KEYWORD_SCORE = 5
+
+# Signalen dat een kandidaat openstaat voor een nieuwe baan
+_OPEN_TO_WORK_CLAUSE = (
+    '(#OpenToWork OR "open to work" OR "actively looking" OR "looking for")'
+)
+
+# Recruitin-specific region mapping for NL
+_REGION_CITIES = {
+    "GELDERLAND": ("Arnhem", "Nijmegen", "Apeldoorn", "Ede", "Doetinchem"),
+    "OVERIJSSEL": ("Zwolle", "Enschede", "Deventer", "Almelo", "Hengelo"),
+    "NOORD-BRABANT": ("Eindhoven", "Tilburg", "Breda", "'s-Hertogenbosch", "Helmond"),
+    "LIMBURG": ("Maastricht", "Venlo", "Roermond", "Heerlen", "Sittard"),
+    "UTRECHT": ("Utrecht", "Amersfoort", "Nieuwegein", "Veenendaal", "Zeist"),
+}
+
+
+def _build_nearby_cities() -> Dict[str, Tuple[str, ...]]:
+    """
+    Map elke stad en regio (hoofdletters) op de steden van zijn regio.
+
+    Bij een naam in meerdere regio's wint de eerste regio, net als bij het
+    doorlopen van _REGION_CITIES op volgorde.
+    """
+    index: Dict[str, Tuple[str, ...]] = {}
+    for region, cities in _REGION_CITIES.items():
+        for city in cities:
+            index.setdefault(city.upper(), cities)
+        index.setdefault(region, cities)
+    return index
+
+
+_NEARBY_CITIES = _build_nearby_cities()
+
+
+def _quote(phrase: str) -> str:
+    """Zet een phrase tussen quotes als het spaties bevat."""
+    if " " in phrase:
+        return f'"{phrase}"'
+    return phrase
+
+
+@lru_cache(maxsize=8192)
+def _or_clause(items: Tuple[str, ...]) -> str:
+    """
+    Bouwt een OR clause van items, gecached per tuple van items.
+
+    Title and skill lists are shared by many searches (cross-matches,
+    hybrid searches, the same functiegroep across vacancies), so the same
+    clause is requested over and over.
+    """
+    return " OR ".join([_quote(item) for item in items if item])
+
+
+@lru_cache(maxsize=1024)
+def _company_clause(companies: Tuple[str, ...]) -> str:
+    """Bouwt een OR clause van company: filters, gecached per tuple van bedrijven."""
+    return " OR ".join([f'company:"{company}"' for company in companies])
 
 
 class BooleanSearchGenerator:
@@ -23,6 +86,69 @@ class BooleanSearchGenerator:
     def __init__(self, functiegroepen: Dict[str, FunctieGroep]):
         """Initialize with function group database."""
         self.functiegroepen = functiegroepen
+        # (automaton, groups), lazily built from functiegroepen
+        self._term_automaton: Optional[Tuple[TermAutomaton, Tuple]] = None
+        # Memoized generate_combined_search results, keyed by group id; not
+        # invalidated when a group's data changes (see clear_cache)
+        self._combined_search_cache: Dict[Tuple, Dict[str, str]] = {}
+
+    def clear_cache(self) -> None:
+        """
+        Drop the memoized searches and the term automaton.
+
+        Call this after modifying ``functiegroepen`` or the data of one of
+        its groups.
+        """
+        self._term_automaton = None
+        self._combined_search_cache.clear()
+
+    def _get_term_automaton(self) -> Tuple[TermAutomaton, Tuple]:
+        """
+        Geeft de (gecachte) automaton met alle termen van alle functiegroepen.
+
+        Payloads are (term number, group position, field, score) tuples; the
+        term number identifies the taxonomy entry so duplicate occurrences in
+        a text are counted once.
+        """
+        if self._term_automaton is None:
+            groups = tuple(self.functiegroepen.values())
+            terms = []
+            for position, fg in enumerate(groups):
+                for title, title_lc in zip(fg._all_titles, fg._all_titles_lc):
+                    terms.append((title_lc, (position, "title", len(title))))
+                for skill in fg.skills:
+                    terms.append((normalize_term(skill), (position, "skill", 0)))
+                for keyword in fg._sector_keywords_lc:
+                    terms.append(
+                        (keyword, (position, "sector_keyword", _SECTOR_KEYWORD_SCORE))
+                    )
+            automaton = TermAutomaton(
+                (term, (number, *payload))
+                for number, (term, payload) in enumerate(terms)
+            )
+            self._term_automaton = (automaton, groups)
+        return self._term_automaton
+
+    def tag_terms(self, text: str) -> List[Tuple[int, int, str, str]]:
+        """
+        Vindt alle titels, skills en sector keywords van alle functiegroepen
+        in een tekst (hoofdletter- en accentongevoelig), in één pass.
+
+        Args:
+            text: Free text such as a vacancy title or description
+
+        Returns:
+            List of (start, end, functiegroep ID, field) tuples ordered by end
+            position, field being "title", "skill" or "sector_keyword".
+            Positions refer to ``normalize_term(text)``.
+        """
+        automaton, groups = self._get_term_automaton()
+        return [
+            (start, end, groups[position].id, field)
+            for start, end, (_, position, field, _) in automaton.iter_matches(
+                normalize_term(text)
+            )
+        ]
 
     def _quote_phrase(self, phrase: str) -> str:
         """
@@ -34,9 +160,7 @@ class BooleanSearchGenerator:
         Returns:
             Quoted phrase if it contains spaces, otherwise original phrase
         """
-        if " " in phrase:
-            return f'"{phrase}"'
-        return phrase
+        return _quote(phrase)
 
     def _build_or_clause(self, items: List[str]) -> str:
         """
@@ -48,8 +172,7 @@ class BooleanSearchGenerator:
         Returns:
             OR clause with properly quoted phrases
         """
-        quoted = [self._quote_phrase(item) for item in items if item]
-        return " OR ".join(quoted)
+        return _or_clause(tuple(items))
 
     def _build_and_clause(self, clauses: List[str]) -> str:
         """
@@ -78,8 +201,7 @@ class BooleanSearchGenerator:
         Returns:
             Boolean search string for job titles
         """
-        all_titles = fg.get_all_titles()
-        return self._build_or_clause(all_titles)
+        return self._build_or_clause(fg._all_titles)
 
     def generate_skill_search(self, fg: FunctieGroep) -> str:
         """
@@ -115,8 +237,7 @@ class BooleanSearchGenerator:
         Returns:
             Boolean search string for competitor companies
         """
-        companies = [f'company:"{c}"' for c in fg.concurrenten]
-        return " OR ".join(companies)
+        return _company_clause(tuple(fg.concurrenten))
 
     def generate_lookalike_company_search(self, fg: FunctieGroep) -> str:
         """
@@ -128,8 +249,7 @@ class BooleanSearchGenerator:
         Returns:
             Boolean search string for typical employer companies
         """
-        companies = [f'company:"{c}"' for c in fg.typische_werkgevers]
-        return " OR ".join(companies)
+        return _company_clause(tuple(fg.typische_werkgevers))
 
     def generate_combined_search(
         self,
@@ -153,19 +273,38 @@ class BooleanSearchGenerator:
         Returns:
             Dict with search type as key and boolean string as value
         """
+        # Alleen groepen uit functiegroepen worden gememoized; een los
+        # FunctieGroep-object met dezelfde id kan andere data hebben
+        if self.functiegroepen.get(fg.id) is not fg:
+            return self._build_combined_search(fg, include_location, location)
+
+        key = (fg.id, include_location, location)
+        searches = self._combined_search_cache.get(key)
+        if searches is None:
+            searches = self._build_combined_search(fg, include_location, location)
+            self._combined_search_cache[key] = searches
+        # Kopie, zodat de aanroeper het resultaat vrij kan aanpassen
+        return dict(searches)
+
+    def _build_combined_search(
+        self, fg: FunctieGroep, include_location: bool, location: Optional[str]
+    ) -> Dict[str, str]:
+        """Bouwt de searches van generate_combined_search (zonder cache)."""
         searches = {}
 
         # 1. BREED - Alle titels
         title_search = self.generate_title_search(fg)
+        # Eén keer tussen haakjes; de meeste varianten beginnen hiermee
+        wrapped_title = f"({title_search})"
         if include_location and location:
-            searches["breed"] = f"({title_search}) AND ({location})"
+            searches["breed"] = f"{wrapped_title} AND ({location})"
         else:
             searches["breed"] = title_search
 
         # 2. SPECIFIEK - Titels + Sector keywords
         sector_search = self._build_or_clause(fg.sector_keywords)
         if sector_search:
-            searches["specifiek"] = f"({title_search}) AND ({sector_search})"
+            searches["specifiek"] = f"{wrapped_title} AND ({sector_search})"
 
         # 3. LOOKALIKE - Typische werkgevers
         company_search = self.generate_lookalike_company_search(fg)
@@ -176,23 +315,20 @@ class BooleanSearchGenerator:
         # 4. COMPETITOR - Concurrent targeting
         competitor_search = self.generate_competitor_search(fg)
         if competitor_search:
-            searches["competitor"] = f"({title_search}) AND ({competitor_search})"
+            searches["competitor"] = f"{wrapped_title} AND ({competitor_search})"
 
         # 5. SKILL - Skill-based search
         skill_search = self.generate_skill_search(fg)
         if skill_search:
-            searches["skill_based"] = f"({title_search}) AND ({skill_search})"
+            searches["skill_based"] = f"{wrapped_title} AND ({skill_search})"
 
         # 6. OPEN_TO_WORK
-        open_to_work = (
-            '(#OpenToWork OR "open to work" OR "actively looking" OR "looking for")'
-        )
-        searches["open_to_work"] = f"({title_search}) AND {open_to_work}"
+        searches["open_to_work"] = f"{wrapped_title} AND {_OPEN_TO_WORK_CLAUSE}"
 
         # 7. CERTIFICATION - Certificering search
         cert_search = self.generate_certification_search(fg)
         if cert_search:
-            searches["certification"] = f"({title_search}) AND ({cert_search})"
+            searches["certification"] = f"{wrapped_title} AND ({cert_search})"
 
         return searches
 
@@ -257,6 +393,30 @@ class BooleanSearchGenerator:
 
         return result
 
+    def match_vacancies(self, titles: Iterable[str]) -> List[Optional[FunctieGroep]]:
+        """
+        Match een reeks vacaturetitels aan hun beste functiegroep.
+
+        Vacaturebestanden bevatten veel dezelfde titels; elke titel wordt
+        één keer genormaliseerd en gematcht (zie _match_vacancy_to_functiegroep).
+
+        Args:
+            titles: Job titles; empty titles give None
+
+        Returns:
+            Best matching FunctieGroep or None, one per title
+        """
+        matches: Dict[str, Optional[FunctieGroep]] = {}
+        result = []
+        for title in titles:
+            if not title:
+                result.append(None)
+                continue
+            if title not in matches:
+                matches[title] = self._match_vacancy_to_functiegroep(title)
+            result.append(matches[title])
+        return result
+
     def _match_vacancy_to_functiegroep(
         self, vacancy_title: str
     ) -> Optional[FunctieGroep]:
@@ -272,27 +432,25 @@ class BooleanSearchGenerator:
         Returns:
             Best matching FunctieGroep or None if no good match
         """
-        title_lower = vacancy_title.lower()
-        best_match = None
-        best_score = 0
-
-        for fg_id, fg in self.functiegroepen.items():
-            score = 0
-            all_titles = fg.get_all_titles()
-
-            for title in all_titles:
-                if title.lower() in title_lower:
-                    score += len(title)  # Langere matches scoren hoger
-
-            for keyword in fg.sector_keywords:
-                if keyword.lower() in title_lower:
-                    score += 5
-
-            if score > best_score:
-                best_score = score
-                best_match = fg
-
-        return best_match
+        automaton, groups = self._get_term_automaton()
+
+        # Elke titel of keyword telt één keer, ook als hij vaker voorkomt
+        found = {}
+        for _, _, (number, position, field, score) in automaton.iter_matches(
+            normalize_term(vacancy_title)
+        ):
+            if field != "skill":
+                found[number] = (position, score)
+
+        scores = [0] * len(groups)
+        for position, score in found.values():
+            scores[position] += score  # Langere titels scoren hoger
+
+        # Bij gelijke score wint de eerste functiegroep
+        best_position = max(range(len(groups)), key=scores.__getitem__, default=None)
+        if best_position is None or scores[best_position] == 0:
+            return None
+        return groups[best_position]
 
     def _get_nearby_locations(self, location: str) -> List[str]:
         """
@@ -304,21 +462,6 @@ class BooleanSearchGenerator:
         Returns:
             List of nearby locations including the base location
         """
-        # Recruitin-specific region mapping for NL
-        region_mapping = {
-            "GELDERLAND": ["Arnhem", "Nijmegen", "Apeldoorn", "Ede", "Doetinchem"],
-            "OVERIJSSEL": ["Zwolle", "Enschede", "Deventer", "Almelo", "Hengelo"],
-            "NOORD-BRABANT": [
-                "Eindhoven",
-                "Tilburg",
-                "Breda",
-                "'s-Hertogenbosch",
-                "Helmond",
-            ],
-            "LIMBURG": ["Maastricht", "Venlo", "Roermond", "Heerlen", "Sittard"],
-            "UTRECHT": ["Utrecht", "Amersfoort", "Nieuwegein", "Veenendaal", "Zeist"],
-        }
-
         # Check input validity
         if location is None or (isinstance(location, float) and str(location) == "nan"):
             return []
@@ -328,15 +471,9 @@ class BooleanSearchGenerator:
             return []
 
         result = [location]
-        for region, cities in region_mapping.items():
-            if location.upper() in [c.upper() for c in cities]:
-                result.extend(cities)
-                break
-            if location.upper() == region:
-                result.extend(cities)
-                break
+        result.extend(_NEARBY_CITIES.get(location.upper(), ()))
 
-        return list(set(result))
+        return list(dict.fromkeys(result))
 
     def _get_priority(self, search_type: str) -> str:
         """Bepaalt de prioriteit van een search type."""
@@ -375,7 +512,7 @@ class BooleanSearchGenerator:
         elif search_type == "lookalike":
             base_filters["current_company"] = company
         elif search_type == "competitor":
-            base_filters["current_past_company"] = fg.concurrenten
+            base_filters["current_past_company"] = list(fg.concurrenten)
 
         return base_filters
 
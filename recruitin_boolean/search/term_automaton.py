@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Term Automaton
+
+Aho-Corasick automaton for finding many taxonomy terms in a piece of text in a
+single pass. Used to tag vacancy titles with the function groups whose titles
+and keywords they contain.
+"""
+
+from collections import deque
+from typing import Dict, Generic, Iterable, Iterator, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class TermAutomaton(Generic[T]):
+    """
+    Multi-pattern substring matcher (Aho-Corasick).
+
+    All occurrences of all terms in a text of length m are found in
+    O(m + number of matches), independent of the number of terms. Matching is
+    case-sensitive; insert lowercase terms and match lowercase text for
+    case-insensitive matching.
+    """
+
+    def __init__(self, terms: Iterable[Tuple[str, T]]):
+        """
+        Build the automaton.
+
+        Args:
+            terms: (term, payload) pairs; the payload is returned with every
+                match of the term. Empty terms are ignored.
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._outputs: List[Tuple[Tuple[int, T], ...]] = [()]
+
+        # Trie van alle termen
+        for term, payload in terms:
+            if not term:
+                continue
+            state = 0
+            for char in term:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._outputs.append(())
+                state = next_state
+            self._outputs[state] += ((len(term), payload),)
+
+        # Failure links, breadth-first zodat kortere suffixen eerst klaar zijn
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail
+                self._outputs[next_state] += self._outputs[fail]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, T]]:
+        """
+        Yield every occurrence of every term in ``text``.
+
+        Args:
+            text: Text to search
+
+        Yields:
+            (start, end, payload) tuples, ``text[start:end]`` being the term
+        """
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, payload in outputs[state]:
+                yield end - length, end, payload
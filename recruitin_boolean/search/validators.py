@@ -10,6 +10,11 @@ from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 import re
 
+# Eén keer gecompileerd; re.sub met een string-patroon zoekt per aanroep
+# eerst in de (kleine) patrooncache van re
+_WS_RE = re.compile(r"\s+")
+_CTRL_RE = re.compile(r"[\x00-\x1f\x7f-\x9f]")
+
 
 @dataclass
 class VacancyInput:
@@ -26,11 +31,11 @@ class VacancyInput:
             raise ValueError("Title cannot be empty")
 
         # Clean up whitespace
-        self.title = re.sub(r"\s+", " ", self.title.strip())
+        self.title = _WS_RE.sub(" ", self.title.strip())
         if self.company:
-            self.company = re.sub(r"\s+", " ", self.company.strip())
+            self.company = _WS_RE.sub(" ", self.company.strip())
         if self.location:
-            self.location = re.sub(r"\s+", " ", self.location.strip())
+            self.location = _WS_RE.sub(" ", self.location.strip())
 
 
 @dataclass
@@ -98,8 +103,8 @@ class SearchValidator:
             return ""
 
         # Remove control characters and normalize whitespace
-        sanitized = re.sub(r"[\x00-\x1f\x7f-\x9f]", "", text)
-        sanitized = re.sub(r"\s+", " ", sanitized.strip())
+        sanitized = _CTRL_RE.sub("", text)
+        sanitized = _WS_RE.sub(" ", sanitized.strip())
 
         return sanitized
 
@@ -109,24 +114,16 @@ class SearchValidator:
         if not query:
             return 0.0
 
-        factors = {
-            "length": min(len(query) / 1000.0, 1.0),
-            "operators": min(
-                (
-                    query.upper().count("AND")
-                    + query.upper().count("OR")
-                    + query.upper().count("NOT")
-                )
-                / 20.0,
-                1.0,
-            ),
-            "parentheses": min(query.count("(") / 10.0, 1.0),
-            "quotes": min(query.count('"') / 20.0, 1.0),
-        }
+        upper = query.upper()
+        length = min(len(query) / 1000.0, 1.0)
+        operators = min(
+            (upper.count("AND") + upper.count("OR") + upper.count("NOT")) / 20.0, 1.0
+        )
+        parentheses = min(query.count("(") / 10.0, 1.0)
+        quotes = min(query.count('"') / 20.0, 1.0)
 
         # Weighted average
-        weights = {"length": 0.3, "operators": 0.4, "parentheses": 0.2, "quotes": 0.1}
-        complexity = sum(factors[key] * weights[key] for key in factors)
+        complexity = length * 0.3 + operators * 0.4 + parentheses * 0.2 + quotes * 0.1
 
         return min(complexity, 1.0)
 